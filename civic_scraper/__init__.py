@@ -2,24 +2,44 @@ import os
 import subprocess
 from importlib.metadata import PackageNotFoundError, version
 
-# Read the installed package version set by setuptools-scm from the git tag.
-# Falls back to "unknown" when the package isn't installed (e.g. running from source).
-try:
-    __version__ = version("civic-scraper")
-except PackageNotFoundError:
-    __version__ = "unknown"
-
-# Capture the current git commit for traceability in dev/editable installs.
-# Falls back to "unknown" when git isn't available (e.g. installed from PyPI).
-try:
-    __git_commit__ = (
-        subprocess.check_output(
-            ["git", "rev-parse", "--short", "HEAD"],
-            cwd=os.path.dirname(__file__),
-            stderr=subprocess.DEVNULL,
+
+def _version():
+    # Read the installed package version set by setuptools-scm from the git tag.
+    # Falls back to "unknown" when the package isn't installed (e.g. running from source).
+    try:
+        return version("civic-scraper")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _git_commit():
+    # Capture the current git commit for traceability in dev/editable installs.
+    # Falls back to "unknown" when git isn't available (e.g. installed from PyPI).
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=os.path.dirname(__file__),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
         )
-        .decode()
-        .strip()
-    )
-except Exception:
-    __git_commit__ = "unknown"
+    except Exception:
+        return "unknown"
+
+
+_LAZY_ATTRS = {"__version__": _version, "__git_commit__": _git_commit}
+
+
+def __getattr__(name):
+    # __version__ and __git_commit__ are computed on first access rather than
+    # at import time, so importing the package (e.g. in every worker process)
+    # doesn't read package metadata or fork a git subprocess.
+    try:
+        compute = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = compute()
+    globals()[name] = value
+    return value
@@ -1,11 +1,17 @@
-import csv
 import datetime
+import hashlib
+import json
 import mimetypes
 import os
 from pathlib import Path
 
 import requests
 
+from .sinks import CsvSink
+
+# Size in bytes of each chunk written to disk while downloading an asset
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class Asset:
     """
@@ -64,35 +70,239 @@ class Asset:
     def __repr__(self):
         return f"Asset({self.url})"
 
-    def download(self, target_dir, session=None, timeout=None):
+    def download(
+        self, target_dir, session=None, timeout=None, manifest=None, store=None
+    ):
         """
         Downloads an asset to a target directory.
 
+        The response body is streamed to a temporary ``.part`` file in
+        fixed-size chunks and renamed into place once complete, so memory
+        use stays flat regardless of file size and a partially written
+        file is never left under the final name. File names include a
+        hash of the URL, so assets that share a meeting id and asset type
+        never write to the same file, even when downloaded concurrently.
+
+        If a transfer is interrupted, the ``.part`` file is kept alongside
+        a small ``.part.json`` sidecar recording the expected length and
+        the ETag/Last-Modified validators. The next call resumes with an
+        HTTP ``Range`` request, falling back to a full fetch if the server
+        does not honor the range or the file has changed.
+
+        When a download manifest is supplied, previously downloaded files
+        whose size and SHA-256 hash still match the manifest are
+        revalidated with ``If-None-Match``/``If-Modified-Since`` and kept
+        as-is on a 304 response, or skipped outright if the server
+        provided no validators. Files that no longer match are fetched
+        again in full.
+
+        When a content store is supplied, the finished file is stored by
+        its SHA-256 hash and the per-asset file becomes a hard link to the
+        stored copy, so identical documents are kept on disk only once.
+
+        If ``content_type`` or ``content_length`` were not populated while
+        scraping, they are filled in from the download response.
+
         Args:
             target_dir (str): target directory name
             session: optional requests.Session to reuse
             timeout (int or float): optional timeout in seconds for the HTTP request
+            manifest (Manifest): optional download manifest to consult and update
+            store (ContentStore): optional content-addressed store for deduplication
 
         Returns:
             Full path to downloaded file
+
+        Raises:
+            requests.HTTPError: If the server responds with an error status
         """
         Path(target_dir).mkdir(parents=True, exist_ok=True)
-        file_extension = mimetypes.guess_extension(self.content_type)
-        file_name = "{}_{}{}".format(
-            # meeting id reflects date and numeric identifier
-            self.meeting_id,
-            self.asset_type,
-            file_extension,
-        )
+        part_path = os.path.join(target_dir, self._part_name())
+        sidecar_path = f"{part_path}.json"
+        record = self._downloaded_record(manifest)
+        if record and not (record.get("etag") or record.get("last_modified")):
+            return record["path"]
+        sidecar = self._resumable_sidecar(part_path, sidecar_path)
+        offset = os.path.getsize(part_path) if sidecar else 0
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            validator = sidecar.get("etag") or sidecar.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+        elif record:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        kwargs = {"headers": headers} if headers else {}
         if session:
-            response = session.get(self.url, allow_redirects=True, timeout=timeout)
+            response = session.get(
+                self.url, allow_redirects=True, timeout=timeout, stream=True, **kwargs
+            )
         else:
-            response = requests.get(self.url, allow_redirects=True, timeout=timeout)
-        full_path = os.path.join(target_dir, file_name)
-        with open(full_path, "wb") as outfile:
-            outfile.write(response.content)
+            response = requests.get(
+                self.url, allow_redirects=True, timeout=timeout, stream=True, **kwargs
+            )
+        try:
+            if record and not offset and response.status_code == 304:
+                return record["path"]
+            if offset and response.status_code == 416:
+                # Saved range is no longer valid; start over from scratch
+                self._discard_partial(part_path, sidecar_path)
+                response.close()
+                return self.download(
+                    target_dir,
+                    session=session,
+                    timeout=timeout,
+                    manifest=manifest,
+                    store=store,
+                )
+            response.raise_for_status()
+            if self.content_type is None:
+                # Content info was not probed during scraping, so fill it
+                # in from the download response
+                self.content_type = response.headers.get("content-type")
+            resuming = offset and self._is_resumed_response(response, offset)
+            hasher = hashlib.sha256()
+            if resuming:
+                _update_hash(hasher, part_path)
+            else:
+                sidecar = self._sidecar_for(response)
+                if sidecar:
+                    with open(sidecar_path, "w") as out:
+                        json.dump(sidecar, out)
+                elif os.path.exists(sidecar_path):
+                    os.remove(sidecar_path)
+            with open(part_path, "ab" if resuming else "wb") as outfile:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    outfile.write(chunk)
+                    hasher.update(chunk)
+            size = os.path.getsize(part_path)
+            expected = sidecar.get("content_length") if sidecar else None
+            if expected is not None and size != expected:
+                raise IOError(
+                    f"Incomplete download of {self.url}: "
+                    f"got {size} of {expected} bytes"
+                )
+            if self.content_length is None:
+                self.content_length = str(size)
+            digest = hasher.hexdigest()
+            if store is not None:
+                # Store the verified file before it is renamed into place,
+                # so the stored object always matches its hash
+                store.add(part_path, digest)
+            full_path = os.path.join(target_dir, self._file_name())
+            os.replace(part_path, full_path)
+            if os.path.exists(sidecar_path):
+                os.remove(sidecar_path)
+        except BaseException:
+            # Keep partial files only when they can be resumed later
+            if not os.path.exists(sidecar_path) and os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        finally:
+            response.close()
+        if manifest is not None:
+            if resuming:
+                etag, last_modified = sidecar.get("etag"), sidecar.get("last_modified")
+            else:
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+            manifest.update(
+                self.url,
+                {
+                    "path": full_path,
+                    "content_length": size,
+                    "sha256": digest,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                },
+            )
         return full_path
 
+    def _downloaded_record(self, manifest):
+        "Return the manifest record for this asset if its file is still intact"
+        record = manifest.get(self.url) if manifest is not None else None
+        if not record:
+            return None
+        path = record.get("path")
+        if not (path and os.path.exists(path)):
+            return None
+        if os.path.getsize(path) != record.get("content_length"):
+            return None
+        # The file may have been overwritten with other bytes of the same size
+        if _sha256(path) != record.get("sha256"):
+            return None
+        return record
+
+    def _resumable_sidecar(self, part_path, sidecar_path):
+        "Return saved resume info for a partial download of this asset, if any"
+        if not (os.path.exists(part_path) and os.path.exists(sidecar_path)):
+            return None
+        try:
+            with open(sidecar_path) as fh:
+                sidecar = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if sidecar.get("url") != self.url:
+            return None
+        return sidecar
+
+    def _sidecar_for(self, response):
+        "Build resume info for a full response, or None if it can't be resumed"
+        headers = response.headers
+        # Byte offsets are meaningless if the body is transparently decoded
+        if headers.get("content-encoding"):
+            return None
+        if headers.get("accept-ranges", "").lower() != "bytes":
+            return None
+        length = headers.get("content-length")
+        return {
+            "url": self.url,
+            "content_length": int(length) if length and length.isdigit() else None,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+        }
+
+    def _is_resumed_response(self, response, offset):
+        content_range = response.headers.get("content-range", "")
+        return response.status_code == 206 and content_range.startswith(
+            f"bytes {offset}-"
+        )
+
+    def _discard_partial(self, part_path, sidecar_path):
+        for path in (part_path, sidecar_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _file_name(self):
+        media_type = (self.content_type or "").split(";")[0].strip()
+        file_extension = mimetypes.guess_extension(media_type) if media_type else None
+        return "{}{}".format(self._file_stem(), file_extension or "")
+
+    def _file_stem(self):
+        # meeting id reflects date and numeric identifier. Assets can share
+        # both (e.g. meetings without an id), so a hash of the URL keeps
+        # each document's file and partial download apart.
+        url_hash = hashlib.sha256(self.url.encode("utf-8")).hexdigest()[:12]
+        return "{}_{}_{}".format(self.meeting_id, self.asset_type, url_hash)
+
+    def _part_name(self):
+        return f"{self._file_stem()}.part"
+
+
+def _update_hash(hasher, path):
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(DOWNLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+
+
+def _sha256(path):
+    hasher = hashlib.sha256()
+    _update_hash(hasher, path)
+    return hasher.hexdigest()
+
 
 class AssetCollection(list):
     def to_csv(self, target_dir):
@@ -107,30 +317,6 @@ class AssetCollection(list):
         Returns:
             Path to file written.
         """
-        headers = [
-            "place",
-            "place_name",
-            "state_or_province",
-            "meeting_date",
-            "meeting_time",
-            "committee_name",
-            "meeting_id",
-            "asset_name",
-            "asset_type",
-            "url",
-            "scraped_by",
-            "content_type",
-            "content_length",
-        ]
-        tstamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M")
-        file_name = f"civic_scraper_assets_meta_{tstamp}z.csv"
-        path = os.path.join(target_dir, file_name)
-        rows = [asset.__dict__ for asset in self]
-        # Ensure output dir exists
-        Path(target_dir).mkdir(parents=True, exist_ok=True)
-        # Write the file
-        with open(path, "w") as out:
-            writer = csv.DictWriter(out, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(rows)
-        return path
+        with CsvSink(target_dir) as sink:
+            sink.write(self)
+        return sink.path
@@ -20,6 +20,11 @@ class Cache:
         "Path for agendas, minutes and other gov file assets"
         return str(Path(self.path).joinpath("assets"))
 
+    @property
+    def asset_objects_path(self):
+        "Path for content-addressed copies of file assets, stored by SHA-256 hash"
+        return str(Path(self.assets_path).joinpath("objects"))
+
     @property
     def artifacts_path(self):
         "Path for HTML and other intermediate artifacts from scraping"
@@ -30,6 +35,21 @@ class Cache:
         "Path for metadata files related to file artifacts"
         return str(Path(self.path).joinpath("metadata"))
 
+    @property
+    def manifests_path(self):
+        "Path for state files tracking what was fetched on previous runs"
+        return str(Path(self.path).joinpath("manifests"))
+
+    @property
+    def download_manifest_path(self):
+        "Path for the manifest of previously downloaded file assets"
+        return str(Path(self.manifests_path).joinpath("downloads.json"))
+
+    @property
+    def feed_manifest_path(self):
+        "Path for the manifest of HTTP validators for previously fetched feeds"
+        return str(Path(self.manifests_path).joinpath("feeds.json"))
+
     @property
     def _path_from_env(self):
         return os.environ.get("CIVIC_SCRAPER_DIR")
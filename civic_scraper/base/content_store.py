@@ -0,0 +1,65 @@
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ContentStore:
+    """Content-addressed storage for downloaded file assets.
+
+    Each unique file is stored once under ``root`` by its SHA-256 hash
+    (e.g. ``objects/ab/abcdef...``) and per-asset file names are hard
+    links to that object. Identical documents linked from several
+    meetings or asset types therefore take up space only once, and
+    checking for a duplicate is a single path lookup.
+
+    On filesystems without hard link support, files are left in place
+    and only the hash index (the download manifest) records duplicates.
+
+    Args:
+        root (str): Directory holding the hashed objects
+    """
+
+    def __init__(self, root):
+        self.root = str(root)
+        self._lock = threading.Lock()
+
+    def object_path(self, sha256):
+        return os.path.join(self.root, sha256[:2], sha256)
+
+    def __contains__(self, sha256):
+        return os.path.exists(self.object_path(sha256))
+
+    def add(self, path, sha256):
+        """Store a file by hash and replace it with a link to the stored copy.
+
+        Args:
+            path (str): Path to a fully downloaded file
+            sha256 (str): Hex SHA-256 digest of the file contents
+
+        Returns:
+            bool: True if identical content was already stored
+        """
+        obj_path = self.object_path(sha256)
+        with self._lock:
+            duplicate = os.path.exists(obj_path)
+            try:
+                if duplicate:
+                    if not os.path.samefile(path, obj_path):
+                        self._relink(obj_path, path)
+                else:
+                    Path(obj_path).parent.mkdir(parents=True, exist_ok=True)
+                    os.link(path, obj_path)
+            except OSError as e:
+                logger.debug(f"Could not link {path} to {obj_path}: {e}")
+        return duplicate
+
+    def _relink(self, obj_path, path):
+        # Link under a temporary name first so the asset path is never missing
+        tmp_path = f"{path}.link"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        os.link(obj_path, tmp_path)
+        os.replace(tmp_path, path)
@@ -0,0 +1,178 @@
+import functools
+import logging
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from pathlib import Path
+
+from .http import SessionPool, host_for
+
+logger = logging.getLogger(__name__)
+
+
+class Downloader:
+    """Download file assets concurrently.
+
+    Downloads run on one long-lived pool of worker threads. Each host
+    gets its own pooled session and may have at most ``max_per_host``
+    downloads in flight. Assets wait in a queue per host and are handed
+    to the pool round-robin as slots free up, so a large sweep can fetch
+    from many servers at once without hammering any one of them, and a
+    long queue for one host never holds up the others. A failed download
+    is recorded and does not stop the remaining downloads.
+
+    Assets can be queued with ``submit`` as they are scraped, and the
+    results collected with ``wait`` once everything has been queued.
+    Only a count of finished downloads and the failures are kept between
+    calls to ``wait``, so memory stays bounded on long sweeps.
+
+    Args:
+        target_dir (str): Directory where files are saved
+        max_workers (int): Max number of downloads in flight overall (default: 1)
+        max_per_host (int): Max number of downloads in flight per host (default: 2)
+        timeout (int or float): Optional timeout in seconds for HTTP requests
+        manifest (Manifest): Optional download manifest used to skip unchanged
+            files. It is saved each time ``wait`` returns.
+        store (ContentStore): Optional content-addressed store used to keep a
+            single copy of identical files
+
+    Public methods:
+        download: downloads a sequence of assets and waits for them
+        submit: queues assets for download without waiting
+        wait: waits for queued downloads and reports how they went
+    """
+
+    def __init__(
+        self,
+        target_dir,
+        max_workers=1,
+        max_per_host=2,
+        timeout=None,
+        manifest=None,
+        store=None,
+    ):
+        self.target_dir = target_dir
+        self.max_workers = max(1, max_workers or 1)
+        self.max_per_host = max(1, max_per_host or 1)
+        self.timeout = timeout
+        self.manifest = manifest
+        self.store = store
+        self.sessions = SessionPool(pool_size=self.max_per_host)
+        self._executor = None
+        self._closed = False
+        # Re-entrant because a future that is already done runs its
+        # callback immediately, from inside _dispatch
+        self._condition = threading.Condition(threading.RLock())
+        self._queues = {}
+        self._in_flight = {}
+        self._downloaded = 0
+        self._failed = []
+        self._next_index = 0
+        self._pending = 0
+
+    def download(self, assets):
+        """Download assets to the target directory.
+
+        Args:
+            assets (iterable): Asset instances to download
+
+        Returns:
+            tuple: (downloaded, failed) where ``downloaded`` is the number
+                of files downloaded or already up to date and ``failed`` is
+                a list of (asset, exception) pairs
+        """
+        self.submit(assets)
+        return self.wait()
+
+    def submit(self, assets):
+        """Queue assets for download and return without waiting.
+
+        Args:
+            assets (iterable): Asset instances to download
+        """
+        with self._condition:
+            if self._executor is None:
+                Path(self.target_dir).mkdir(parents=True, exist_ok=True)
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            for asset in assets:
+                if not asset.url:
+                    continue
+                queue = self._queues.setdefault(host_for(asset.url), deque())
+                queue.append((self._next_index, asset))
+                self._next_index += 1
+                self._pending += 1
+            self._dispatch()
+
+    def wait(self):
+        """Wait for every queued download to finish.
+
+        Returns:
+            tuple: (downloaded, failed) as returned by ``download``, for all
+                assets queued since the last call. Failures are listed in
+                the order their assets were queued.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._pending)
+            downloaded, self._downloaded = self._downloaded, 0
+            self._failed.sort(key=lambda failure: failure[0])
+            failed = [(asset, error) for _, asset, error in self._failed]
+            self._failed.clear()
+        if self.manifest is not None:
+            self.manifest.save()
+        return downloaded, failed
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._queues.clear()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+        self.sessions.close()
+
+    def _dispatch(self):
+        "Hand queued assets to the pool while their hosts have free slots"
+        with self._condition:
+            if self._closed:
+                return
+            for host in list(self._queues):
+                queue = self._queues.get(host, ())
+                while queue and self._in_flight.get(host, 0) < self.max_per_host:
+                    index, asset = queue.popleft()
+                    self._in_flight[host] = self._in_flight.get(host, 0) + 1
+                    future = self._executor.submit(self._download_one, asset)
+                    future.add_done_callback(
+                        functools.partial(self._done, host, index, asset)
+                    )
+                if not queue:
+                    self._queues.pop(host, None)
+
+    def _done(self, host, index, asset, future):
+        try:
+            error = future.result()
+        except CancelledError as e:
+            error = e
+        with self._condition:
+            self._in_flight[host] -= 1
+            if error is None:
+                self._downloaded += 1
+            else:
+                self._failed.append((index, asset, error))
+            self._pending -= 1
+            self._dispatch()
+            self._condition.notify_all()
+
+    def _download_one(self, asset):
+        "Download one asset and return the exception it raised, if any"
+        try:
+            logger.info(f"\t{asset.url}")
+            asset.download(
+                self.target_dir,
+                session=self.sessions.get(asset.url),
+                timeout=self.timeout,
+                manifest=self.manifest,
+                store=self.store,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to download {asset.url}: {e}")
+            return e
+        return None
@@ -0,0 +1,101 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .http import HostLimiter, SessionPool, interleave_by_host
+
+logger = logging.getLogger(__name__)
+
+
+class FileMetaProber:
+    """Populate content_type and content_length for assets via HEAD requests.
+
+    HEAD requests run on a bounded pool of worker threads with at most
+    ``max_per_host`` requests in flight to any single host. Results are
+    cached by URL, so assets sharing a document URL (or a prober reused
+    across scrapes) cost a single request. A failed request is logged
+    and leaves the asset's content info unset.
+
+    Args:
+        max_workers (int): Max number of HEAD requests in flight overall (default: 1)
+        max_per_host (int): Max number of HEAD requests in flight per host (default: 4)
+        timeout (int or float): Optional timeout in seconds for HTTP requests
+        session (requests.Session): Optional session to use for every request,
+            e.g. to send a platform's headers or cookies. By default each
+            host gets its own pooled session.
+        missing_length: Value for content_length when the server does not
+            send a Content-Length header (default: None)
+
+    Public methods:
+        probe: fills content info in place for a sequence of assets
+    """
+
+    def __init__(
+        self,
+        max_workers=1,
+        max_per_host=4,
+        timeout=None,
+        session=None,
+        missing_length=None,
+    ):
+        self.max_workers = max(1, max_workers or 1)
+        self.max_per_host = max(1, max_per_host or 1)
+        self.timeout = timeout
+        self.session = session
+        self.missing_length = missing_length
+        self.sessions = SessionPool(pool_size=self.max_per_host)
+        self.limiter = HostLimiter(self.max_per_host)
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def probe(self, assets):
+        """Fill content_type and content_length on each asset in place.
+
+        Args:
+            assets (iterable): Asset instances, e.g. an AssetCollection
+
+        Returns:
+            The same assets
+        """
+        urls = interleave_by_host(
+            list(dict.fromkeys(asset.url for asset in assets if asset.url)),
+            key=lambda url: url,
+        )
+        if self.max_workers > 1 and len(urls) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self.file_meta, urls))
+        else:
+            for url in urls:
+                self.file_meta(url)
+        for asset in assets:
+            if not asset.url:
+                continue
+            meta = self.file_meta(asset.url)
+            if meta is not None:
+                asset.content_type, asset.content_length = meta
+        return assets
+
+    def file_meta(self, url):
+        """Return (content_type, content_length) for a URL, or None on failure."""
+        with self._lock:
+            if url in self._cache:
+                return self._cache[url]
+        session = self.session or self.sessions.get(url)
+        try:
+            with self.limiter.limit(url):
+                headers = session.head(
+                    url, allow_redirects=True, timeout=self.timeout
+                ).headers
+            meta = (
+                headers.get("content-type"),
+                headers.get("content-length", self.missing_length),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get headers for {url}: {e}")
+            meta = None
+        with self._lock:
+            self._cache[url] = meta
+        return meta
+
+    def close(self):
+        self.sessions.close()
@@ -0,0 +1,204 @@
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def host_for(url):
+    "Return the lowercased host (and port, if any) of a URL"
+    return urlparse(url).netloc.lower()
+
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by host.
+
+    Each host gets its own bucket holding up to ``burst`` tokens that
+    refill at ``rate`` tokens per second. A request spends one token,
+    waiting only when its own host's bucket is empty, so requests to
+    different hosts never delay each other. Safe to share between threads.
+
+    Args:
+        rate (float): Default requests per second for each host.
+            None or 0 disables limiting (default: None)
+        burst (int): Default number of requests a host may receive
+            back to back before the rate applies (default: 1)
+    """
+
+    def __init__(self, rate=None, burst=1):
+        self._host_rates = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+
+    def configure(self, rate=None, burst=1):
+        "Set the default rate and burst for hosts without their own limit"
+        with self._lock:
+            self.rate = rate
+            self.burst = max(1, burst or 1)
+
+    def set_rate(self, url, rate, burst=1):
+        "Set the rate and burst for the host of a URL, overriding the default"
+        with self._lock:
+            self._host_rates[host_for(url)] = (rate, max(1, burst or 1))
+
+    def wait(self, url):
+        """Block until a request to the URL's host is allowed.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        host = host_for(url)
+        with self._lock:
+            rate, burst = self._host_rates.get(host, (self.rate, self.burst))
+            if not rate:
+                return 0
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            self._buckets[host] = (tokens, now)
+        # A negative balance reserves a slot after the requests already waiting
+        delay = -tokens / rate if tokens < 0 else 0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+# Shared by every platform so each host sees one polite request rate
+rate_limiter = HostRateLimiter()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that waits on a HostRateLimiter before each request.
+
+    Args:
+        limiter (HostRateLimiter): Limiter to use (default: the shared one)
+        **kwargs: Passed to HTTPAdapter
+    """
+
+    def __init__(self, limiter=None, **kwargs):
+        self.limiter = limiter or rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.wait(request.url)
+        return super().send(request, **kwargs)
+
+
+def rate_limit_session(session, pool_size=10, limiter=None):
+    """Mount rate-limited, pooled adapters on an existing session.
+
+    Args:
+        session (requests.Session): Session to modify in place
+        pool_size (int): Max number of keep-alive connections per host
+        limiter (HostRateLimiter): Limiter to use (default: the shared one)
+
+    Returns:
+        The same session
+    """
+    adapter = RateLimitedAdapter(
+        limiter=limiter, pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_session(pool_size=10, headers=None, limiter=None):
+    """Create a requests.Session with a connection pool sized for concurrency.
+
+    Requests made through the session are throttled by the shared
+    per-host rate limiter unless another limiter is given.
+
+    Args:
+        pool_size (int): Max number of keep-alive connections per host
+        headers (dict): Optional default headers for the session
+        limiter (HostRateLimiter): Limiter to use (default: the shared one)
+
+    Returns:
+        requests.Session
+    """
+    session = rate_limit_session(requests.Session(), pool_size, limiter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+class SessionPool:
+    """Hands out one pooled requests.Session per host.
+
+    Reusing a session per host keeps TCP/TLS connections alive across
+    requests to the same server, while separate hosts never contend
+    for the same connection pool.
+
+    Args:
+        pool_size (int): Max number of keep-alive connections per host
+        headers (dict): Optional default headers for each session
+    """
+
+    def __init__(self, pool_size=10, headers=None):
+        self.pool_size = pool_size
+        self.headers = headers
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        host = host_for(url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = create_session(self.pool_size, self.headers)
+                self._sessions[host] = session
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+class HostLimiter:
+    """Caps the number of concurrent requests made to any single host.
+
+    Args:
+        max_per_host (int): Max number of in-flight requests per host
+    """
+
+    def __init__(self, max_per_host=2):
+        self.max_per_host = max_per_host
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def limit(self, url):
+        host = host_for(url)
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+        with semaphore:
+            yield
+
+
+def interleave_by_host(items, key=lambda item: item.url):
+    """Reorder items round-robin by host.
+
+    Spreading work for the same host across the queue keeps workers
+    busy on other hosts instead of all waiting on one host's limit.
+    Relative order of items for any single host is preserved.
+    """
+    by_host = {}
+    for item in items:
+        by_host.setdefault(host_for(key(item)), []).append(item)
+    queues = list(by_host.values())
+    ordered = []
+    index = 0
+    while queues:
+        queues = [queue for queue in queues if len(queue) > index]
+        ordered.extend(queue[index] for queue in queues)
+        index += 1
+    return ordered
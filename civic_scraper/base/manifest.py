@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Serializes saves of the same file by Manifest instances in one process
+_path_locks = {}
+_path_locks_lock = threading.Lock()
+
+
+def _path_lock(path):
+    key = os.path.realpath(path)
+    with _path_locks_lock:
+        return _path_locks.setdefault(key, threading.Lock())
+
+
+class Manifest:
+    """JSON file of records keyed by URL.
+
+    Used to remember what was fetched on previous runs (e.g. HTTP
+    validators and content hashes for downloaded assets) so later
+    runs can skip or conditionally request unchanged files. Records
+    are held in memory and only written to disk on ``save``. Safe to
+    share between threads, and several instances may save the same
+    file: each save re-reads the file and merges in only the records
+    this instance changed.
+
+    Args:
+        path (str): Path to the JSON file. Missing files are treated as empty.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._records = self._load()
+        # Records changed since the last save; None marks a removal
+        self._changes = {}
+
+    def get(self, url):
+        with self._lock:
+            record = self._records.get(url)
+            return dict(record) if record else None
+
+    def update(self, url, record):
+        with self._lock:
+            self._records[url] = dict(record)
+            self._changes[url] = dict(record)
+
+    def remove(self, url):
+        with self._lock:
+            self._records.pop(url, None)
+            self._changes[url] = None
+
+    def save(self):
+        "Merge changed records into the file on disk and atomically replace it"
+        with self._lock, _path_lock(self.path):
+            records = self._load()
+            for url, record in self._changes.items():
+                if record is None:
+                    records.pop(url, None)
+                else:
+                    records[url] = record
+            parent = Path(self.path).parent
+            parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=parent, prefix=f"{Path(self.path).name}.", suffix=".tmp"
+            )
+            try:
+                # mkstemp creates owner-only files
+                os.chmod(tmp_path, 0o644)
+                with os.fdopen(fd, "w") as out:
+                    json.dump(records, out, indent=1, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            self._records = records
+            self._changes = {}
+
+    def __len__(self):
+        return len(self._records)
+
+    def _load(self):
+        try:
+            with open(self.path) as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
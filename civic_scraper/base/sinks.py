@@ -0,0 +1,126 @@
+import csv
+import datetime
+import json
+import os
+from pathlib import Path
+
+# Columns of the asset metadata file, in order
+METADATA_FIELDS = [
+    "place",
+    "place_name",
+    "state_or_province",
+    "meeting_date",
+    "meeting_time",
+    "committee_name",
+    "meeting_id",
+    "asset_name",
+    "asset_type",
+    "url",
+    "scraped_by",
+    "content_type",
+    "content_length",
+]
+
+
+class MetadataSink:
+    """Base class for files that asset metadata is streamed to.
+
+    The file is created when the sink is opened and each call to
+    ``write`` appends rows and flushes them to disk, so metadata for
+    every batch written survives a crash later in the run. Sinks are
+    context managers that close the file on exit.
+
+    Args:
+        target_dir (str): Directory where the metadata file is created
+
+    Attributes:
+        path (str): Path of the metadata file
+        count (int): Number of assets written so far
+    """
+
+    extension = None
+
+    def __init__(self, target_dir):
+        tstamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M")
+        file_name = f"civic_scraper_assets_meta_{tstamp}z.{self.extension}"
+        Path(target_dir).mkdir(parents=True, exist_ok=True)
+        self.path = os.path.join(target_dir, file_name)
+        self.count = 0
+        self._file = open(self.path, "w", newline="")
+        self._open()
+        self._file.flush()
+
+    def write(self, assets):
+        "Append metadata for a batch of assets and flush it to disk"
+        rows = [self._row(asset) for asset in assets]
+        self._write_rows(rows)
+        self._file.flush()
+        self.count += len(rows)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _row(self, asset):
+        return {field: getattr(asset, field, None) for field in METADATA_FIELDS}
+
+    def _open(self):
+        pass
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+
+class CsvSink(MetadataSink):
+    "Streams asset metadata to a CSV file with a header row"
+
+    extension = "csv"
+
+    def _open(self):
+        self._writer = csv.DictWriter(self._file, fieldnames=METADATA_FIELDS)
+        self._writer.writeheader()
+
+    def _write_rows(self, rows):
+        self._writer.writerows(rows)
+
+
+class JsonlSink(MetadataSink):
+    "Streams asset metadata to a JSON Lines file, one asset per line"
+
+    extension = "jsonl"
+
+    def _write_rows(self, rows):
+        for row in rows:
+            # Dates and times are written as in the CSV, via str()
+            self._file.write(json.dumps(row, default=str) + "\n")
+
+
+SINKS = {
+    "csv": CsvSink,
+    "jsonl": JsonlSink,
+}
+
+
+def open_sink(target_dir, output_format="csv"):
+    """Open a metadata sink for an output format.
+
+    Args:
+        target_dir (str): Directory where the metadata file is created
+        output_format (str): One of the keys in ``SINKS`` (default: csv)
+
+    Returns:
+        MetadataSink instance
+    """
+    try:
+        sink_kls = SINKS[output_format]
+    except KeyError:
+        raise ValueError(
+            f"Unknown metadata format {output_format!r}. "
+            f"Expected one of: {', '.join(SINKS)}"
+        )
+    return sink_kls(target_dir)
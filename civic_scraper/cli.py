@@ -5,6 +5,8 @@ import os
 import click
 from click_option_group import RequiredMutuallyExclusiveOptionGroup, optgroup
 
+from civic_scraper.base.http import rate_limiter
+from civic_scraper.base.sinks import SINKS
 from civic_scraper.runner import PLATFORMS, Runner
 from civic_scraper.utils import default_user_home, today_local_str
 
@@ -50,6 +52,14 @@ def cli():
         " by setting the CIVIC_SCRAPER_DIR environment variable."
     ),
 )
+@click.option(
+    "--dedupe/--no-dedupe",
+    default=False,
+    help=(
+        "Store downloaded files once by content hash under the assets"
+        " directory and hard-link each asset's file name to the stored copy."
+    ),
+)
 @click.option(
     "-c",
     "--cache/--no-cache",
@@ -73,6 +83,63 @@ def cli():
     type=click.Choice(list(PLATFORMS.keys()), case_sensitive=False),
     help="Force a specific platform instead of auto-detecting from the URL.",
 )
+@click.option(
+    "-w",
+    "--workers",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of sites to scrape concurrently. By default, sites are scraped one at a time.",
+)
+@click.option(
+    "--download-workers",
+    default=None,
+    type=click.IntRange(min=1),
+    help=(
+        "Number of file assets to download concurrently, with at most two"
+        " downloads per host at a time. Defaults to the value of --workers."
+    ),
+)
+@click.option(
+    "--file-meta/--no-file-meta",
+    default=None,
+    help=(
+        "Whether to send a HEAD request per file asset for its content type"
+        " and length on platforms that support it, such as CivicPlus. With"
+        " --no-file-meta, content info is filled in when a file is downloaded."
+        " By default, each platform's own default applies."
+    ),
+)
+@click.option(
+    "--file-meta-workers",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of file asset HEAD requests to send concurrently on platforms that support it.",
+)
+@click.option(
+    "--metadata-format",
+    type=click.Choice(list(SINKS.keys()), case_sensitive=False),
+    default=None,
+    help=(
+        "Format of the metadata file, written incrementally as each site"
+        " finishes. Defaults to csv."
+    ),
+)
+@click.option(
+    "--rate-limit",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    help=(
+        "Max requests per second to any single host. Requests to different"
+        " hosts are not limited by each other. By default, only hosts with"
+        " their own platform limit are throttled."
+    ),
+)
+@click.option(
+    "--rate-burst",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of requests a host may receive back to back before --rate-limit applies.",
+)
 @optgroup.group(
     "Site sources",
     cls=RequiredMutuallyExclusiveOptionGroup,
@@ -84,10 +151,29 @@ def cli():
     type=click.File("r"),
     help="CSV containing a 'url' field for target sites. An optional 'platform' column overrides auto-detection per row.",
 )
-def scrape(start_date, end_date, download, cache, timeout, platform, url, urls_file):
+def scrape(
+    start_date,
+    end_date,
+    download,
+    dedupe,
+    cache,
+    timeout,
+    platform,
+    workers,
+    download_workers,
+    file_meta,
+    file_meta_workers,
+    metadata_format,
+    rate_limit,
+    rate_burst,
+    url,
+    urls_file,
+):
     """Scrape one or more government sites."""
     cache_path = os.environ.get("CIVIC_SCRAPER_DIR", DEFAULT_USER_HOME)
     runner = Runner(cache_path=cache_path)
+    if rate_limit:
+        rate_limiter.configure(rate_limit, rate_burst)
     # TODO - Do not pass download to scrapers. Runner already downloads
     # assets after scraping, so this isScrapers should just return asset
     # URLs and metadata. Refactor in a future PR.
@@ -97,9 +183,24 @@ def scrape(start_date, end_date, download, cache, timeout, platform, url, urls_f
         "cache": cache,
         "download": download,
         "timeout": timeout,
+        # Assets are written to the metadata file as each site finishes,
+        # so the CLI has no use for the in-memory collection
+        "keep_assets": False,
     }
     if platform:
         kwargs["platform"] = platform
+    if workers:
+        kwargs["max_workers"] = workers
+    if download_workers:
+        kwargs["download_workers"] = download_workers
+    if dedupe:
+        kwargs["dedupe"] = dedupe
+    if file_meta is not None:
+        kwargs["fetch_file_meta"] = file_meta
+    if file_meta_workers:
+        kwargs["file_meta_workers"] = file_meta_workers
+    if metadata_format:
+        kwargs["output_format"] = metadata_format.lower()
     if url:
         kwargs["site_urls"] = [url]
     else:
@@ -1,6 +1,31 @@
-from .civic_clerk.site import CivicClerkSite
-from .civic_plus.site import Site as CivicPlusSite
-from .digital_tow_path.site import DigitalTowPathSite
-from .granicus.site import GranicusSite
-from .legistar.site import Site as LegistarSite
-from .primegov.site import PrimeGovSite
+import importlib
+
+# Site classes are imported on first access rather than up front, so
+# that scraping one platform does not pay for importing the third-party
+# dependencies of every other platform (e.g. legistar, demjson3, feedparser).
+# Maps each public class name to its defining submodule and attribute.
+SITE_CLASSES = {
+    "CivicClerkSite": (".civic_clerk.site", "CivicClerkSite"),
+    "CivicPlusSite": (".civic_plus.site", "Site"),
+    "DigitalTowPathSite": (".digital_tow_path.site", "DigitalTowPathSite"),
+    "GranicusSite": (".granicus.site", "GranicusSite"),
+    "LegistarSite": (".legistar.site", "Site"),
+    "PrimeGovSite": (".primegov.site", "PrimeGovSite"),
+}
+
+__all__ = list(SITE_CLASSES)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = SITE_CLASSES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    site_class = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = site_class
+    return site_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,17 +1,90 @@
 import html
+import json
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
 import demjson3 as demjson
 import lxml.html
-from requests import Session
+from lxml import etree
 
-import civic_scraper
 from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
 from civic_scraper.base.cache import Cache
+from civic_scraper.base.http import create_session
+from civic_scraper.utils import parse_date, scraped_by
+
+# Expressions evaluated for every event row or agenda frame, compiled once
+EVENT_LINK = etree.XPath("./td[contains(@id, '_3')]//a")
+EVENT_COMMITTEE_TEXT = etree.XPath("./td[contains(@id, '_3')]//text()")
+EVENT_DATETIME_TEXT = etree.XPath("./td[contains(@id, '_4')]//text()")
+FUTURE_EVENT_ROWS = etree.XPath(
+    "//table[@id='aspxroundpanelCurrent_pnlDetails_grdEventsCurrent_DXMainTable']/tr[@class='dxgvDataRow_CustomThemeModerno']"
+)
+PAST_EVENT_ROWS = etree.XPath(
+    "//table[@id='aspxroundpanelRecent2_ASPxPanel4_grdEventsRecent2_DXMainTable']/tr[@class='dxgvDataRow_CustomThemeModerno']"
+)
+DOC_VIEWER_FRAME = etree.XPath("//iframe[@id='docViewer']")
+FRAME_TABLES = etree.XPath("//table")
+FRAME_ITEM_ROWS = etree.XPath(
+    "//tr[./td[@class='dx-wrap dxtl dxtl__B0' and not(@colspan)]]"
+)
+NEXT_ROW = etree.XPath("./following-sibling::tr[1]")
+LINKS = etree.XPath(".//a")
+OWN_TEXT = etree.XPath("./text()")
+ALL_TEXT = etree.XPath("//text()")
+MEETING_ID_RE = re.compile(r".*?\((?P<id>.*?),.*")
+STATE_OBJECT_RE = re.compile(r"^dxo\.stateObject = \((?P<body>.*)\);$", re.MULTILINE)
+CALLBACK_BODY_RE = re.compile(r".*?/\*DX\*/\((?P<body>.*)\)")
+
+# Strings (either quote style) and bare object keys in a JavaScript literal
+JS_TOKEN_RE = re.compile(
+    r""""(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[A-Za-z_$][\w$]*(?=\s*:)""",
+    re.DOTALL,
+)
+# Escape sequences and bare double quotes inside a single-quoted string
+JS_ESCAPE_RE = re.compile(r'\\(.)|"', re.DOTALL)
+
+
+def _js_escape_to_json(match):
+    if match.group(0) == '"':
+        return '\\"'
+    if match.group(1) == "'":
+        return "'"
+    return match.group(0)
+
+
+def _js_token_to_json(match):
+    token = match.group(0)
+    if token[0] == '"':
+        return token
+    if token[0] == "'":
+        return '"' + JS_ESCAPE_RE.sub(_js_escape_to_json, token[1:-1]) + '"'
+    return f'"{token}"'
+
+
+def decode_js(text):
+    """Decode a JavaScript object literal such as a DevExpress callback state.
+
+    Single-quoted strings and bare keys are rewritten as JSON so the C json
+    parser can be used. Anything it rejects (e.g. hex escapes or
+    ``undefined``) falls back to demjson, which is much slower.
+    """
+    try:
+        return json.loads(JS_TOKEN_RE.sub(_js_token_to_json, text), strict=False)
+    except ValueError:
+        return demjson.decode(text)
+
+
+def encode_js(obj):
+    "Encode an object as compact JSON, matching demjson's output"
+    try:
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True)
+    except TypeError:
+        return demjson.encode(obj)
 
 
 class CivicClerkSite(base.Site):
@@ -24,7 +97,7 @@ class CivicClerkSite(base.Site):
         self.state_or_province = state_or_province
         self.cache = cache if cache is not None else Cache()
 
-        self.session = Session()
+        self.session = create_session()
         self.session.headers["User-Agent"] = (
             "Mozilla/5.0 (X11; CrOS x86_64 12871.102.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/81.0.4044.141 Safari/537.36"
         )
@@ -48,17 +121,16 @@ class CivicClerkSite(base.Site):
             "meeting_date": meeting_datetime.date(),
             "meeting_time": meeting_datetime.time(),
             "meeting_id": meeting_id,
-            "scraped_by": f"civic-scraper_{civic_scraper.__version__}",
+            "scraped_by": scraped_by(),
             "content_type": "txt",
             "content_length": None,
         }
         return Asset(**e)
 
     def get_meeting_id(self, event):
-        link = event.xpath("./td[contains(@id, '_3')]//a")[0]
+        link = EVENT_LINK(event)[0]
         href = link.attrib["href"]
-        pattern = r".*?\((?P<id>.*?),.*"
-        match = re.match(pattern, href)
+        match = MEETING_ID_RE.match(href)
         return (
             match.group("id"),
             "civicclerk_{}_{}".format(self.civicclerk_instance, match.group("id")),
@@ -67,7 +139,7 @@ class CivicClerkSite(base.Site):
     def get_agenda_items(self, text):
         event_tree = lxml.html.fromstring(text)
 
-        event_frame = event_tree.xpath("//iframe[@id='docViewer']")[0]
+        event_frame = DOC_VIEWER_FRAME(event_tree)[0]
 
         if "src" not in event_frame.attrib:
             return []
@@ -76,50 +148,54 @@ class CivicClerkSite(base.Site):
 
         frame_response = self.session.get(event_frame_url, timeout=self.timeout)
         frame_tree = lxml.html.fromstring(frame_response.text)
-        frame_has_table = True if frame_tree.xpath("//table") else False
+        frame_has_table = True if FRAME_TABLES(frame_tree) else False
 
         assets = []
 
         if frame_has_table:
-            assets_list = frame_tree.xpath(
-                "//tr[./td[@class='dx-wrap dxtl dxtl__B0' and not(@colspan)]]"
-            )
+            assets_list = FRAME_ITEM_ROWS(frame_tree)
             for item in assets_list:
-                link_tr_text = item.xpath("./following-sibling::tr[1]")[0]
-                for tr in link_tr_text.xpath(".//a"):
+                link_tr_text = NEXT_ROW(item)[0]
+                for tr in LINKS(link_tr_text):
                     if tr.attrib["href"] != "#":
                         asset_url = self.base_url + "/Web" + tr.attrib["href"][2:]
-                        asset_name = tr.xpath("./text()")[0]
+                        asset_name = OWN_TEXT(tr)[0]
                         assets.append((asset_url, asset_name))
         else:
             no_agenda_str = "Agenda content has not been published for this meeting."
-            if no_agenda_str not in frame_tree.xpath("//text()"):
+            if no_agenda_str not in ALL_TEXT(frame_tree):
                 assets.append((event_frame_url, None))
 
         return assets
 
-    def events(self):
+    def events(self, start_date=None):
+        """Yield event rows, upcoming events first.
 
+        Args:
+            start_date (datetime.date): Optionally stop paginating past
+                events once a page reaches events before this date
+        """
         yield from self._future_events()
-        yield from self._past_events()
+        yield from self._past_events(start_date)
 
     def _future_events(self):
 
         callback_id = "aspxroundpanelCurrent$pnlDetails$grdEventsCurrent"
         for page in self._paginate(callback_id):
-            events = page.xpath(
-                "//table[@id='aspxroundpanelCurrent_pnlDetails_grdEventsCurrent_DXMainTable']/tr[@class='dxgvDataRow_CustomThemeModerno']"
-            )
+            events = FUTURE_EVENT_ROWS(page)
             yield from events
 
-    def _past_events(self):
+    def _past_events(self, start_date=None):
 
         callback_id = "aspxroundpanelRecent2$ASPxPanel4$grdEventsRecent2"
         for page in self._paginate(callback_id):
-            events = page.xpath(
-                "//table[@id='aspxroundpanelRecent2_ASPxPanel4_grdEventsRecent2_DXMainTable']/tr[@class='dxgvDataRow_CustomThemeModerno']"
-            )
+            events = PAST_EVENT_ROWS(page)
             yield from events
+            # Past events are listed newest first, so later pages are older still
+            if start_date and any(
+                self._event_datetime(event).date() < start_date for event in events
+            ):
+                break
 
     def _paginate(self, callback_id):
 
@@ -156,12 +232,8 @@ class CivicClerkSite(base.Site):
             )
         )
 
-        callback_state = demjson.decode(
-            re.search(
-                r"^dxo\.stateObject = \((?P<body>.*)\);$",
-                event_callback_source,
-                re.MULTILINE,
-            ).group("body")
+        callback_state = decode_js(
+            STATE_OBJECT_RE.search(event_callback_source).group("body")
         )
 
         # You may wonder why we are encoding the callback_state back to a string
@@ -169,11 +241,11 @@ class CivicClerkSite(base.Site):
         #
         # The reasons is that the original string uses single quotes and is
         # not html-escaped, and we need to use double quotes and html escape.
-        payload[callback_id] = html.escape(demjson.encode(callback_state))
+        payload[callback_id] = html.escape(encode_js(callback_state))
 
         item_keys = callback_state["keys"]
         payload["__CALLBACKPARAM"] = "c0:KV|61;{};GB|20;12|PAGERONCLICK3|PBN;".format(
-            demjson.encode(item_keys)
+            encode_js(item_keys)
         )
 
         # We'll break when we attempt to paginate to a next
@@ -185,11 +257,9 @@ class CivicClerkSite(base.Site):
             response = self.session.post(self.url, payload, timeout=self.timeout)
             previous_item_keys = item_keys
 
-            data_str = re.match(r".*?/\*DX\*/\((?P<body>.*)\)", response.text).group(
-                "body"
-            )
+            data_str = CALLBACK_BODY_RE.match(response.text).group("body")
 
-            data = demjson.decode(data_str)
+            data = decode_js(data_str)
 
             table_tree = lxml.html.fromstring(data["result"]["html"])
 
@@ -197,31 +267,60 @@ class CivicClerkSite(base.Site):
 
             callback_state = data["result"]["stateObject"]
 
-            payload[callback_id] = html.escape(demjson.encode(callback_state))
+            payload[callback_id] = html.escape(encode_js(callback_state))
 
             item_keys = callback_state["keys"]
             payload["__CALLBACKPARAM"] = (
                 "c0:KV|61;"
-                + demjson.encode(callback_state["keys"])
+                + encode_js(callback_state["keys"])
                 + ";GB|20;12|PAGERONCLICK3|PBN;"
             )
 
-    def scrape(self, download=True, timeout=None):
+    def scrape(
+        self,
+        start_date=None,
+        end_date=None,
+        download=False,
+        cache=False,
+        timeout=None,
+        max_workers=4,
+    ):
+        """Scrape meeting assets from the CivicClerk site.
+
+        Event detail and agenda frame pages are fetched on a bounded pool of
+        threads while pagination continues, so listing pages and detail
+        pages are requested concurrently. Assets keep the listing order.
+
+        Past events are paginated only until they reach ``start_date``,
+        and detail pages are fetched only for events within the date range.
+
+        Args:
+            start_date (str): YYYY-MM-DD start date (default: no lower bound)
+            end_date (str): YYYY-MM-DD end date (default: no upper bound)
+            download (bool): Download file assets (default: False)
+            cache (bool): Unused; accepted for compatibility with the Runner
+            timeout (int): Timeout in seconds for HTTP requests (default: None)
+            max_workers (int): Number of events to fetch concurrently (default: 4)
+
+        Returns:
+            AssetCollection: Collection of Asset instances
+        """
         self.timeout = timeout
 
         ac = AssetCollection()
 
-        for event in self.events():
-            committee_name = event.xpath("./td[contains(@id, '_3')]//text()")[1].strip()
-            str_datetime = event.xpath("./td[contains(@id, '_4')]//text()")[0].strip()
-            meeting_datetime = datetime.strptime(str_datetime, "%m/%d/%Y %I:%M %p")
-            meeting_id_num, meeting_id = self.get_meeting_id(event)
-
-            event_url = f"{self.base_url}/Web/DocumentFrame.aspx?id={meeting_id_num}&mod=-1&player_tab=-2"
-            event_response = self.session.get(event_url, timeout=self.timeout)
-
-            agenda_items = self.get_agenda_items(event_response.text)
-
+        start = parse_date(start_date).date() if start_date else None
+        end = parse_date(end_date).date() if end_date else None
+        events = (
+            meta
+            for meta in map(self._event_meta, self.events(start))
+            if (start is None or meta[1].date() >= start)
+            and (end is None or meta[1].date() <= end)
+        )
+        for meta, agenda_items in self._pipeline(
+            self._fetch_agenda_items, events, max_workers
+        ):
+            committee_name, meeting_datetime, meeting_id_num, meeting_id = meta
             if agenda_items:
                 assets = [
                     self.create_asset(a, committee_name, meeting_datetime, meeting_id)
@@ -243,3 +342,46 @@ class CivicClerkSite(base.Site):
                     )
 
         return ac
+
+    def _event_datetime(self, event):
+        str_datetime = EVENT_DATETIME_TEXT(event)[0].strip()
+        return datetime.strptime(str_datetime, "%m/%d/%Y %I:%M %p")
+
+    def _event_meta(self, event):
+        committee_name = EVENT_COMMITTEE_TEXT(event)[1].strip()
+        meeting_datetime = self._event_datetime(event)
+        meeting_id_num, meeting_id = self.get_meeting_id(event)
+        return committee_name, meeting_datetime, meeting_id_num, meeting_id
+
+    def _fetch_agenda_items(self, meta):
+        meeting_id_num = meta[2]
+        event_url = f"{self.base_url}/Web/DocumentFrame.aspx?id={meeting_id_num}&mod=-1&player_tab=-2"
+        event_response = self.session.get(event_url, timeout=self.timeout)
+        return self.get_agenda_items(event_response.text)
+
+    @staticmethod
+    def _pipeline(func, items, max_workers):
+        """Yield (item, func(item)) pairs in input order.
+
+        Up to ``max_workers`` calls run on worker threads while ``items``
+        is still being consumed, with a bounded number of results buffered
+        so a slow producer or consumer cannot grow memory without limit.
+        """
+        if not max_workers or max_workers <= 1:
+            for item in items:
+                yield item, func(item)
+            return
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for item in items:
+                    pending.append((item, executor.submit(func, item)))
+                    if len(pending) >= max_workers * 2:
+                        item, future = pending.popleft()
+                        yield item, future.result()
+                while pending:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+            finally:
+                for _, future in pending:
+                    future.cancel()
@@ -5,6 +5,21 @@ import bs4
 
 from civic_scraper.base.constants import SUPPORTED_ASSET_TYPES
 
+CATEGORY_DIV_ID_RE = re.compile(r"cat\d+")
+FILE_LINK_HREF_RE = re.compile(r"^/AgendaCenter/ViewFile")
+MEETING_NAME_DATE_RE = re.compile(r"_(\d{2})(\d{2})(\d{4}).+")
+
+
+def file_links_with_no_title(tag):
+    "bs4 filter for asset file links, skipping the titled download menu copies"
+    # HTML link appears in meeting title and download menu.
+    # This filters out the initial link
+    return (
+        tag.name == "a"
+        and tag.get("href", "").startswith("/AgendaCenter/ViewFile")
+        and not tag.has_attr("title")
+    )
+
 
 class ParsingError(Exception):
     pass
@@ -22,21 +37,11 @@ class Parser:
 
     def _get_divs_by_board(self):
         "Locate top-level divs containing meeting details for each board or entity"
-        return self.soup.find_all("div", id=re.compile(r"cat\d+"))
+        return self.soup.find_all("div", id=CATEGORY_DIV_ID_RE)
 
     def _extract_asset_data(self, divs):
         "Extract asset-level data from each board/entity div"
 
-        # bs4 helper
-        def file_links_with_no_title(tag):
-            # HTML link appears in meeting title and download menu.
-            # This filters out the initial link
-            return (
-                tag.name == "a"
-                and tag.get("href", "").startswith("/AgendaCenter/ViewFile")
-                and not tag.has_attr("title")
-            )
-
         metadata = []
         # Links often appear twice (once under meeting title, once in download menu)
         # so we track which we've already seen to avoid duplicate entries
@@ -49,7 +54,7 @@ class Parser:
             for row in div.tbody.find_all("tr"):
                 meeting_title = self._mtg_title(row)
                 meeting_id = self._mtg_id(row)
-                links = row.find_all(file_links_with_no_title)
+                links = self._file_links(row)
                 # Each meeting has multiple asset types
                 for link in links:
                     # Skip links to page listing previous agenda versions
@@ -72,6 +77,9 @@ class Parser:
                     bookkeeping.add(link["href"])
         return metadata
 
+    def _file_links(self, row):
+        return row.find_all(file_links_with_no_title)
+
     def _committee_name(self, div):
         # If present, remove span that contains
         # arrow ▼ for toggling meeting list
@@ -86,7 +94,7 @@ class Parser:
         return row.p.text.strip()
 
     def _mtg_date(self, row):
-        month, day, year = re.match(r"_(\d{2})(\d{2})(\d{4}).+", row.a["name"]).groups()
+        month, day, year = MEETING_NAME_DATE_RE.match(row.a["name"]).groups()
         return datetime(int(year), int(month), int(day))
 
     def _mtg_id(self, row):
@@ -104,3 +112,26 @@ class Parser:
 
     def _previous_version_link(self, link):
         return "PreviousVersions" in link["href"]
+
+
+class LxmlParser(Parser):
+    """Faster Parser for large search results pages.
+
+    Builds the tree with bs4's lxml builder and only keeps the ``cat\\d+``
+    board divs, and matches file links on tag attributes rather than with
+    a Python callback. Produces the same metadata as Parser.
+
+    Usage:
+        CivicPlusSite(url, parser_kls=LxmlParser)
+    """
+
+    def __init__(self, html):
+        self.html = html
+        self.soup = bs4.BeautifulSoup(
+            html,
+            "lxml",
+            parse_only=bs4.SoupStrainer("div", id=CATEGORY_DIV_ID_RE),
+        )
+
+    def _file_links(self, row):
+        return row.find_all("a", href=FILE_LINK_HREF_RE, title=False)
@@ -4,12 +4,11 @@ import re
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import requests
-
-import civic_scraper
 from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
-from civic_scraper.utils import today_local_str
+from civic_scraper.base.file_meta import FileMetaProber
+from civic_scraper.base.http import create_session
+from civic_scraper.utils import scraped_by, today_local_str
 
 from .parser import Parser
 
@@ -33,8 +32,7 @@ class Site(base.Site):
         self.state_or_province = self._get_asset_metadata(
             r"(?<=//)\w{2}(?=-)", base_url
         )
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        self.session = create_session(headers=HEADERS)
 
     @property
     def place(self):
@@ -51,6 +49,8 @@ class Site(base.Site):
         file_size=None,
         asset_list=None,
         timeout=None,
+        fetch_file_meta=True,
+        file_meta_workers=1,
     ):
         """Scrape a government website for metadata and/or docs.
 
@@ -62,6 +62,14 @@ class Site(base.Site):
             file_size (float): Max size in Megabytes of file assets to download
             asset_list (list): Optional list of SUPPORTED_ASSET_TYPES to
                 to limit items to be scraped (e.g. agenda, minutes). (default: [])
+            timeout (int): Timeout in seconds for HTTP requests (default: None)
+            fetch_file_meta (bool): Populate content_type and content_length via
+                a HEAD request for each asset. When False, no HEAD requests are
+                made and content info is filled in from the response if the asset
+                is later downloaded. Implied when download=True and file_size is
+                given. (default: True)
+            file_meta_workers (int): Number of HEAD requests to run concurrently
+                when fetching file metadata (default: 1)
 
         Returns:
             AssetCollection: A sequence of Asset instances
@@ -80,6 +88,8 @@ class Site(base.Site):
             logger.info(f"Cached search results page HTML: {cache_path}")
         file_metadata = self.parser_kls(raw_html).parse()
         assets = self._build_asset_collection(file_metadata)
+        if fetch_file_meta or (download and file_size):
+            self._fetch_file_meta(assets, max_workers=file_meta_workers)
         if download:
             asset_dir = Path(self.cache.path, "assets")
             asset_dir.mkdir(parents=True, exist_ok=True)
@@ -92,7 +102,11 @@ class Site(base.Site):
     def _skippable(self, asset, file_size, asset_list):
         if file_size:
             max_bytes = self._mb_to_bytes(file_size)
-            if float(asset.content_length) > max_bytes:
+            # Size is unknown when the HEAD request failed, so let it through
+            if (
+                asset.content_length is not None
+                and float(asset.content_length) > max_bytes
+            ):
                 return True
         if asset_list:
             if asset.asset_type in asset_list:
@@ -153,23 +167,22 @@ class Site(base.Site):
                 "meeting_time": row["meeting_time"],
                 "asset_name": row["meeting_title"],
                 "asset_type": row["asset_type"],
-                "scraped_by": f"civic-scraper_{civic_scraper.__version__}",
+                "scraped_by": scraped_by(),
                 "url": url,
             }
-            # TODO: Add conditional here to short-circuit
-            # header request based on method option
-            response_headers = self.session.head(
-                url, allow_redirects=True, timeout=self.timeout
-            ).headers
-            asset_args.update(
-                {
-                    "content_type": response_headers["content-type"],
-                    "content_length": response_headers.get("content-length", -1),
-                }
-            )
             assets.append(Asset(**asset_args))
         return assets
 
+    def _fetch_file_meta(self, assets, max_workers=1):
+        "Fill content_type and content_length for assets via HEAD requests"
+        prober = FileMetaProber(
+            max_workers=max_workers,
+            timeout=self.timeout,
+            session=self.session,
+            missing_length=-1,
+        )
+        prober.probe(assets)
+
     def _mk_url(self, url, url_path):
         base_url = url.split("/Agenda")[0]
         return urljoin(base_url, url_path)
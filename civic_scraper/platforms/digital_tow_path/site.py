@@ -7,12 +7,14 @@ For more information on the platform, see:
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urlparse
 
-import civic_scraper
 from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
+from civic_scraper.base.file_meta import FileMetaProber
+from civic_scraper.utils import scraped_by
 
 from . import utils
 
@@ -37,13 +39,23 @@ class DigitalTowPathSite(base.Site):
         self.meeting_slug = re.sub(r"[^a-z0-9]+", "-", self.domain).strip("-")
 
     def scrape(
-        self, start_date: str, end_date: str, timeout: int = None, **kwargs
+        self,
+        start_date: str,
+        end_date: str,
+        timeout: int = None,
+        max_workers: int = 4,
+        **kwargs,
     ) -> AssetCollection:
         """Scrape the jurisdiction website for meeting documents.
 
         Args:
             start_date (str): YYYY-MM-DD format (required)
             end_date (str): YYYY-MM-DD format (required)
+            timeout (int): Timeout in seconds for HTTP requests
+                (default: 30 for pages, 10 for HEAD requests)
+            max_workers (int): Number of meeting detail pages and document
+                HEAD requests to fetch concurrently. Requests still respect
+                the per-host rate limit. (default: 4)
 
         Returns:
             AssetCollection: Collection of Asset instances
@@ -125,35 +137,41 @@ class DigitalTowPathSite(base.Site):
                         )
                         continue
 
-                    # Process each meeting
+                    # Select meetings to process
+                    pending = []
                     for meeting in meetings:
                         if meeting["detail_id"] in processed_details:
                             continue
                         processed_details.add(meeting["detail_id"])
-                        try:
-                            asset_count = self._process_meeting(
-                                meeting,
-                                category_name,
-                                start_dt,
-                                end_dt,
-                                ac,
-                                scrape_timeout=scrape_timeout,
-                                head_timeout=head_timeout,
-                            )
-                            logger.debug(
-                                f"Added {asset_count} assets from meeting {meeting['detail_id']}"
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to process meeting {meeting['detail_id']}: {e}"
-                            )
+                        # Skip the detail page fetch when the listing date is out of range
+                        listing_date = utils.parse_listing_date(meeting["title"])
+                        if listing_date and not (start_dt <= listing_date <= end_dt):
                             continue
+                        pending.append(meeting)
+
+                    # Fetch detail pages concurrently, keeping listing order
+                    for assets in self._map(
+                        lambda meeting: self._safe_process_meeting(
+                            meeting,
+                            category_name,
+                            start_dt,
+                            end_dt,
+                            scrape_timeout=scrape_timeout,
+                        ),
+                        pending,
+                        max_workers,
+                    ):
+                        ac.extend(assets)
 
                     # Extract other years from the same soup (no extra request)
                     try:
                         other_years = utils.get_other_years_from_soup(soup)
                         for year_info in other_years:
                             year_url = year_info["url"]
+                            if not utils.year_in_range(
+                                year_info["year"], start_dt, end_dt
+                            ):
+                                continue
                             if year_url not in processed_urls:
                                 meetings_to_process.append((year_url, category_name))
                     except Exception as e:
@@ -166,30 +184,50 @@ class DigitalTowPathSite(base.Site):
                 logger.error(f"Failed to process category {category_name}: {e}")
                 continue
 
+        # Fill content type and length for all documents in one pass
+        FileMetaProber(
+            max_workers=max_workers, timeout=head_timeout, session=self.session
+        ).probe(ac)
+
         logger.info(f"Scraping complete. Found {len(ac)} total assets")
         return ac
 
+    @staticmethod
+    def _map(func, items, max_workers):
+        "Apply func to items on up to max_workers threads, preserving order"
+        if max_workers and max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(func, items))
+        return [func(item) for item in items]
+
+    def _safe_process_meeting(self, meeting, *args, **kwargs):
+        "Process a meeting, logging failures instead of raising"
+        try:
+            assets = self._process_meeting(meeting, *args, **kwargs)
+        except Exception as e:
+            logger.warning(f"Failed to process meeting {meeting['detail_id']}: {e}")
+            return []
+        logger.debug(f"Added {len(assets)} assets from meeting {meeting['detail_id']}")
+        return assets
+
     def _process_meeting(
         self,
         meeting,
         category_name,
         start_dt,
         end_dt,
-        ac,
         scrape_timeout=30,
-        head_timeout=10,
     ):
-        """Process a single meeting and add assets to collection.
+        """Process a single meeting into assets.
 
         Args:
             meeting (dict): Meeting info from utils.get_meetings_for_category_year()
             category_name (str): Committee/category name
             start_dt (datetime.date): Start of date range (inclusive)
             end_dt (datetime.date): End of date range (inclusive)
-            ac (AssetCollection): Collection to add assets to
 
         Returns:
-            int: Number of assets added
+            list: Asset instances for the meeting's documents
         """
         detail_url = meeting["url"]
         detail_id = meeting["detail_id"]
@@ -203,13 +241,13 @@ class DigitalTowPathSite(base.Site):
         meeting_date = meeting_details.get("meeting_date")
         if not meeting_date:
             logger.warning(f"No meeting date for {detail_id}")
-            return 0
+            return []
 
         if not (start_dt <= meeting_date <= end_dt):
             logger.debug(f"Meeting {detail_id} ({meeting_date}) outside date range")
-            return 0
+            return []
 
-        asset_count = 0
+        assets = []
 
         # Create an asset for each document (agenda, minutes)
         for doc in meeting_details.get("documents", []):
@@ -224,19 +262,6 @@ class DigitalTowPathSite(base.Site):
             # Create asset name
             asset_name = f"{meeting_details.get('meeting_title', 'Meeting')} - {doc_type.capitalize()}"
 
-            # TODO: HEAD-per-document is slow and arguably a Runner/download-time
-            # concern. Consider moving to base Asset or Runner layer.
-            content_type = None
-            content_length = None
-            try:
-                response = self.session.head(
-                    doc_url, allow_redirects=True, timeout=head_timeout
-                )
-                content_type = response.headers.get("content-type")
-                content_length = response.headers.get("content-length")
-            except Exception as e:
-                logger.warning(f"Failed to get headers for {doc_url}: {e}")
-
             # Create datetime object for meeting
             meeting_datetime = utils.parse_meeting_datetime(
                 meeting_date, meeting_details.get("meeting_time")
@@ -250,12 +275,9 @@ class DigitalTowPathSite(base.Site):
                 committee_name=meeting_details.get("committee_name") or category_name,
                 meeting_date=meeting_datetime,
                 meeting_id=meeting_id,
-                scraped_by=f"civic-scraper_{civic_scraper.__version__}",
-                content_type=content_type,
-                content_length=content_length,
+                scraped_by=scraped_by(),
             )
 
-            ac.append(asset)
-            asset_count += 1
+            assets.append(asset)
 
-        return asset_count
+        return assets
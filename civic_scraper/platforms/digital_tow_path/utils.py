@@ -5,18 +5,23 @@ These functions are testable components of the scraping logic.
 """
 
 import logging
-import time
+import re
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
+from civic_scraper.base.http import create_session as create_pooled_session
+from civic_scraper.base.http import rate_limiter
+
 logger = logging.getLogger(__name__)
 
 CATEGORIES_PATH = "/meetings/meetings/"
 
-# Polite delay between requests (seconds)
+# Meeting listing titles start with the date, e.g. "February 11, 2026: ..."
+LISTING_DATE_RE = re.compile(r"^\s*([A-Za-z]+ \d{1,2}, \d{4})")
+
+# Polite delay between requests to a DigitalTowPath host (seconds)
 REQUEST_DELAY = 1.0
 
 
@@ -25,14 +30,15 @@ def create_session():
 
     Using a session maintains cookies across requests and reuses
     TCP connections, which looks more like a real browser and is
-    more polite to the server.
+    more polite to the server. Requests are throttled per host by
+    the shared rate limiter, at the rate fetch_page registers for
+    each DigitalTowPath host.
 
     Returns:
         requests.Session: Configured session
     """
-    session = requests.Session()
-    session.headers.update(
-        {
+    return create_pooled_session(
+        headers={
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -45,7 +51,6 @@ def create_session():
             "Upgrade-Insecure-Requests": "1",
         }
     )
-    return session
 
 
 def fetch_page(url, session=None, referer=None, timeout=30):
@@ -64,12 +69,13 @@ def fetch_page(url, session=None, referer=None, timeout=30):
     """
     if session is None:
         session = create_session()
+    # Throttle only this host, leaving other sites free to run in parallel
+    rate_limiter.set_rate(url, 1 / REQUEST_DELAY)
 
     headers = {}
     if referer:
         headers["Referer"] = referer
 
-    time.sleep(REQUEST_DELAY)
     response = session.get(url, headers=headers, timeout=timeout)
     response.raise_for_status()
     return BeautifulSoup(response.text, "html.parser")
@@ -359,3 +365,37 @@ def extract_detail_id_from_url(url):
         str: Detail ID (e.g., "30")
     """
     return url.split("/meetings/detail/")[-1].rstrip("/")
+
+
+def parse_listing_date(title):
+    """Parse the meeting date from a category page listing title.
+
+    Args:
+        title (str): Title like "February 11, 2026: February Regular Town Board Meeting"
+
+    Returns:
+        datetime.date: Meeting date, or None if the title has no recognizable date
+    """
+    match = LISTING_DATE_RE.match(title or "")
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%B %d, %Y").date()
+    except ValueError:
+        return None
+
+
+def year_in_range(year, start_dt, end_dt):
+    """Check whether a category year page may hold meetings in a date range.
+
+    Args:
+        year (str): Year label from get_other_years_from_soup() (e.g. "2025")
+        start_dt (datetime.date): Start of date range (inclusive)
+        end_dt (datetime.date): End of date range (inclusive)
+
+    Returns:
+        bool: False only when the year is known to fall outside the range
+    """
+    if not str(year).isdigit():
+        return True
+    return start_dt.year <= int(year) <= end_dt.year
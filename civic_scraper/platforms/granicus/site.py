@@ -1,14 +1,20 @@
-from datetime import datetime
+import calendar
+import hashlib
+import logging
+from datetime import date, datetime, timezone
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
 import feedparser
-from requests import Session
 
-import civic_scraper
 from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
 from civic_scraper.base.cache import Cache
+from civic_scraper.base.http import create_session
+from civic_scraper.base.manifest import Manifest
+from civic_scraper.utils import parse_date, scraped_by
+
+logger = logging.getLogger(__name__)
 
 
 class GranicusSite(base.Site):
@@ -47,25 +53,84 @@ class GranicusSite(base.Site):
             "meeting_date": meeting_datetime.date(),
             "meeting_time": meeting_datetime.time(),
             "meeting_id": meeting_id,
-            "scraped_by": f"civic-scraper_{civic_scraper.__version__}",
+            "scraped_by": scraped_by(),
             "content_type": "txt",
             "content_length": None,
         }
         return Asset(**e)
 
-    def scrape(self, download=True, timeout=None):
-        session = Session()
+    def scrape(
+        self,
+        start_date=None,
+        end_date=None,
+        download=False,
+        cache=False,
+        timeout=None,
+        incremental=False,
+    ):
+        """Scrape the RSS feed for metadata and/or docs.
+
+        Entries are filtered by the date they were published to the feed
+        before being parsed into assets. Entries without a publish date
+        are always kept.
+
+        Once the assets are built, the feed's ETag and Last-Modified headers
+        are saved in the feed manifest under ``cache.manifests_path`` along
+        with a cached copy of the feed, and sent with the next request. When the server
+        responds 304 Not Modified, the cached feed is parsed instead.
+
+        Args:
+            start_date (str): YYYY-MM-DD. Skip entries published before this
+                date (default: no lower bound)
+            end_date (str): YYYY-MM-DD. Skip entries published after this
+                date (default: no upper bound)
+            download (bool): Download file assets (default: False)
+            cache (bool): Accepted for consistency with other platforms.
+                The feed is always cached for conditional requests.
+            timeout (int): Timeout in seconds for HTTP requests (default: None)
+            incremental (bool): Only return entries published after the
+                newest entry seen on the previous run. An unchanged feed
+                returns no assets without being parsed. (default: False)
+
+        Returns:
+            AssetCollection: A sequence of Asset instances
+        """
+        session = create_session()
         session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (X11; CrOS x86_64 12871.102.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/81.0.4044.141 Safari/537.36"
             }
         )
+        manifest = Manifest(self.cache.feed_manifest_path)
+        record = manifest.get(self.url) or {}
+
+        response = self._get_feed(session, record, timeout)
+        text = None
+        if response.status_code == 304:
+            if incremental:
+                logger.info(f"Feed not modified since last run: {self.url}")
+                return AssetCollection()
+            text = self._cached_feed(record)
+            if text is None:
+                # Cached copy is gone, so fetch the full feed again
+                response = self._get_feed(session, {}, timeout)
+        if text is None:
+            response.raise_for_status()
+            text = response.text
+        parsed_rss = feedparser.parse(text)
 
-        response = session.get(self.url, timeout=timeout)
-        parsed_rss = feedparser.parse(response.text)
+        last_seen = record.get("last_published") if incremental else None
+        start = parse_date(start_date).date() if start_date else None
+        end = parse_date(end_date).date() if end_date else None
+        entries = [
+            entry
+            for entry in parsed_rss["entries"]
+            if self._in_range(entry, start, end)
+            and (not last_seen or self._published(entry, default="") > last_seen)
+        ]
 
         ac = AssetCollection()
-        assets = [self.create_asset(e) for e in parsed_rss["entries"]]
+        assets = [self.create_asset(e) for e in entries]
         for a in assets:
             ac.append(a)
 
@@ -77,4 +142,62 @@ class GranicusSite(base.Site):
                     dir_str = str(asset_dir)
                     asset.download(target_dir=dir_str, session=session, timeout=timeout)
 
+        # Only advance the manifest once every entry has been handled, so a
+        # failed run sees the same entries again instead of a 304
+        if response.status_code != 304:
+            self._save_feed(manifest, record, response, text, parsed_rss["entries"])
         return ac
+
+    def _get_feed(self, session, record, timeout):
+        headers = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return session.get(self.url, headers=headers, timeout=timeout)
+
+    def _cached_feed(self, record):
+        try:
+            with open(record["path"]) as fh:
+                return fh.read()
+        except (KeyError, OSError):
+            return None
+
+    def _save_feed(self, manifest, record, response, text, entries):
+        url_hash = hashlib.sha1(self.url.encode("utf-8")).hexdigest()[:12]
+        cache_path = (
+            f"{self.cache.artifacts_path}/granicus/"
+            f"{self.granicus_instance}_{url_hash}.xml"
+        )
+        published = [self._published(entry) for entry in entries]
+        published = [p for p in published if p] + [record.get("last_published")]
+        manifest.update(
+            self.url,
+            {
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "path": self.cache.write(cache_path, text),
+                "last_published": max(filter(None, published), default=None),
+            },
+        )
+        manifest.save()
+
+    def _in_range(self, entry, start, end):
+        published = entry.get("published_parsed")
+        if not published:
+            return True
+        published_date = date(*published[:3])
+        if start and published_date < start:
+            return False
+        if end and published_date > end:
+            return False
+        return True
+
+    def _published(self, entry, default=None):
+        "Return an entry's published time as a UTC ISO 8601 string"
+        published = entry.get("published_parsed")
+        if not published:
+            return default
+        return datetime.fromtimestamp(
+            calendar.timegm(published), tz=timezone.utc
+        ).isoformat()
@@ -1,14 +1,39 @@
+import datetime
 import re
+from collections import deque
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 
-import requests
+import pytz
 from legistar.events import LegistarEventsScraper
+from lxml import etree
 
-import civic_scraper
 from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
-from civic_scraper.utils import dtz_to_dt, mb_to_bytes, parse_date, today_local_str
+from civic_scraper.base.file_meta import FileMetaProber
+from civic_scraper.base.http import create_session, rate_limit_session
+from civic_scraper.utils import (
+    dtz_to_dt,
+    mb_to_bytes,
+    parse_date,
+    scraped_by,
+    today_local_str,
+)
+
+EVENTS_TABLE = etree.XPath(
+    "//div[@id='ctl00_ContentPlaceHolder1_MultiPageCalendar']//table[@class='rgMasterTable']"
+)
+
+# Legistar Web API: https://webapi.legistar.com/Help
+API_EVENTS_URL = "https://webapi.legistar.com/v1/{client}/events"
+# Max number of records the Web API returns per request
+API_PAGE_SIZE = 1000
+# Web API event fields holding the file for each asset type
+API_FILE_FIELDS = {
+    "Agenda": "EventAgendaFile",
+    "Minutes": "EventMinutesFile",
+}
+BACKENDS = ("html", "api")
 
 
 class Site(base.Site):
@@ -24,11 +49,20 @@ class Site(base.Site):
         cache=None,
         parser_kls=None,
         timezone=None,
+        backend="html",
+        pool_size=10,
     ):
         super().__init__(base_url, cache, parser_kls)
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown Legistar backend {backend!r}. "
+                f"Expected one of: {', '.join(BACKENDS)}"
+            )
         self.legistar_instance = urlparse(base_url).netloc.split(".")[0]
         self.timezone = timezone
         self.event_info_keys = event_info_keys
+        self.backend = backend
+        self.pool_size = pool_size
 
     def scrape(
         self,
@@ -39,6 +73,7 @@ class Site(base.Site):
         asset_list=None,
         timeout=None,
         fetch_file_meta=False,
+        max_workers=1,
     ):
         """Scrape a government website for metadata and/or docs.
         Args:
@@ -53,6 +88,8 @@ class Site(base.Site):
             fetch_file_meta (bool): Populate content_type and content_length via
                 HEAD request for each asset without downloading. Implied when
                 download=True. (default: False)
+            max_workers (int): Max number of concurrent HEAD requests when
+                fetching file metadata (default: 1)
         Returns:
             AssetCollection: A sequence of Asset instances
         """
@@ -62,23 +99,15 @@ class Site(base.Site):
         today = today_local_str()
         start_date = start_date or today
         end_date = end_date or today
-        webscraper = LegistarEventsScraper(
-            event_info_key=self.event_info_keys["meeting_details_info"],
-            retry_attempts=3,
-        )
-
-        # required to instantiate webscraper
-        webscraper.BASE_URL = urlparse(self.url).netloc
-        webscraper.EVENTSPAGE = self.url
-        webscraper.TIMEZONE = self.timezone
-        webscraper.date_format = "%m/%d/%Y %I:%M %p"
+        if self.backend == "api":
+            session = create_session(pool_size=self.pool_size)
+            events = self._api_events(session, start_date, end_date)
+        else:
+            webscraper = self._webscraper()
+            events = self._events(webscraper, start_date, end_date)
 
         ac = AssetCollection()
-        start_year = int(start_date[:4])
-        events_since_start_year = webscraper.events(since=start_year)
-        events = [event[0] for event in events_since_start_year]
-        for event in events:
-            meeting_meta = self._extract_meeting_meta(event, webscraper)
+        for event, meeting_meta in events:
             for asset_type in asset_list:
                 # Skip if a dictionary containing 'url' key is not present for the given asset type
                 try:
@@ -86,16 +115,23 @@ class Site(base.Site):
                 except TypeError:
                     continue
                 # Apply date and other filters
-                if self._skippable(
-                    asset,
-                    start_date,
-                    end_date,
-                    file_size=file_size,
-                    download=download,
-                    fetch_file_meta=fetch_file_meta,
-                ):
+                if self._skippable(asset, start_date, end_date):
                     continue
                 ac.append(asset)
+        if self.backend != "api":
+            session = self._file_session(webscraper)
+        # Add Content Type and Length when download or fetch_file_meta specified
+        if download or fetch_file_meta:
+            self._add_file_meta(ac, session, max_workers)
+        # if file_size and download are given, then check byte count
+        if file_size and download:
+            max_bytes = mb_to_bytes(file_size)
+            ac = AssetCollection(
+                asset
+                for asset in ac
+                if asset.content_length is None
+                or float(asset.content_length) <= max_bytes
+            )
         if download:
             asset_dir = Path(self.cache.path, "assets")
             asset_dir.mkdir(parents=True, exist_ok=True)
@@ -104,19 +140,142 @@ class Site(base.Site):
                     dir_str = str(asset_dir)
                     asset.download(
                         target_dir=dir_str,
-                        session=webscraper,
+                        session=session,
                         timeout=self.timeout,
                     )
         return ac
 
-    def _add_file_meta(self, asset):
+    def _webscraper(self):
+        webscraper = LegistarEventsScraper(
+            event_info_key=self.event_info_keys["meeting_details_info"],
+            retry_attempts=3,
+        )
+
+        # required to instantiate webscraper
+        webscraper.BASE_URL = urlparse(self.url).netloc
+        webscraper.EVENTSPAGE = self.url
+        webscraper.TIMEZONE = self.timezone
+        webscraper.date_format = "%m/%d/%Y %I:%M %p"
+        rate_limit_session(webscraper, pool_size=self.pool_size)
+        return webscraper
+
+    def _file_session(self, webscraper):
+        """Return a pooled session for file metadata probes and downloads.
+
+        The calendar scraper throttles itself to one request per second,
+        which would make every probe and download wait. File requests go
+        through a plain pooled session carrying the scraper's headers and
+        cookies instead, so connections to the site are kept alive and
+        reused by concurrent probes.
+        """
+        session = create_session(pool_size=self.pool_size)
+        session.headers.update(webscraper.headers)
+        session.cookies.update(webscraper.cookies)
+        return session
+
+    def _events(self, webscraper, start_date, end_date):
+        """Yield (event, meeting_meta) for calendar events in a date range.
+
+        Only calendar years overlapping the range are requested. Legistar
+        lists each year's events newest first, so iteration stops at the
+        first event before start_date instead of paging through the rest
+        of the year.
+        """
+        start = parse_date(start_date)
+        end = parse_date(end_date)
+        # Calendars list events up to one year ahead
+        last_year = min(end.year, webscraper.now().year + 1)
+        # Events added mid-scrape shift the listing, so skip recent repeats
+        scraped_events = deque([], maxlen=10)
+        for year in range(last_year, start.year - 1, -1):
+            for page in webscraper.eventPages(year):
+                events_table = EVENTS_TABLE(page)[0]
+                for event, _, _ in webscraper.parseDataTable(events_table):
+                    ical_url = event["iCalendar"]["url"]
+                    if ical_url in scraped_events:
+                        continue
+                    scraped_events.append(ical_url)
+                    meeting_meta = self._extract_meeting_meta(event, webscraper)
+                    meeting_date = meeting_meta["meeting_date"]
+                    if meeting_date < start:
+                        return
+                    if meeting_date > end:
+                        continue
+                    yield event, meeting_meta
+
+    def _api_events(self, session, start_date, end_date):
+        """Yield (event, meeting_meta) for Web API events in a date range.
+
+        The range is filtered server side and results are paged with
+        $top/$skip, so a scrape costs one request per API_PAGE_SIZE
+        events instead of one per calendar page. Events are converted
+        to the shape of a calendar table row, so assets are built the
+        same way for both backends.
+        """
+        start = parse_date(start_date)
+        end = parse_date(end_date)
+        url = API_EVENTS_URL.format(client=self.legistar_instance)
+        params = {
+            "$filter": (
+                f"EventDate ge datetime'{start:%Y-%m-%d}' "
+                f"and EventDate le datetime'{end:%Y-%m-%d}'"
+            ),
+            "$orderby": "EventDate desc",
+            "$top": API_PAGE_SIZE,
+        }
+        skip = 0
+        while True:
+            response = session.get(
+                url, params={**params, "$skip": skip}, timeout=self.timeout
+            )
+            response.raise_for_status()
+            records = response.json()
+            for record in records:
+                event = self._api_event(record)
+                yield event, self._api_meeting_meta(record, event)
+            if len(records) < API_PAGE_SIZE:
+                return
+            skip += len(records)
+
+    def _api_event(self, record):
+        event = {"Name": record["EventBodyName"]}
+        for asset_type, field in API_FILE_FIELDS.items():
+            file_url = record.get(field)
+            event[asset_type] = {"url": file_url} if file_url else None
+        return event
+
+    def _api_meeting_meta(self, record, event):
+        date_info = record["EventDate"][:10]
+        time_info = record.get("EventTime") or None
+        if not (time_info and re.match(r"\d*?:\d{2} \w{2}", time_info)):
+            time_info = "12:00 AM"
+        meeting_time = datetime.datetime.strptime(
+            f"{date_info} {time_info}", "%Y-%m-%d %I:%M %p"
+        )
+        if self.timezone:
+            meeting_time = pytz.timezone(self.timezone).localize(meeting_time)
+        return {
+            "committee_name": self._event_name(event),
+            "place": None,
+            "state_or_province": None,
+            "meeting_date": dtz_to_dt(meeting_time),
+            "meeting_time": meeting_time,
+            "meeting_id": "legistar_{}_{}".format(
+                self.legistar_instance, record["EventId"]
+            ),
+            "scraped_by": scraped_by(),
+        }
+
+    def _add_file_meta(self, assets, session, max_workers=1):
         # Note: LegistarEventsScraper (third-party) does not accept a timeout;
-        # only our own requests.head() call is covered here.
-        headers = requests.head(
-            asset.url, allow_redirects=True, timeout=self.timeout
-        ).headers
-        asset.content_type = headers.get("content-type")
-        asset.content_length = headers.get("content-length", "-1")
+        # only our own HEAD requests are covered here.
+        FileMetaProber(
+            max_workers=max_workers,
+            max_per_host=self.pool_size,
+            timeout=self.timeout,
+            session=session,
+            missing_length="-1",
+        ).probe(assets)
 
     def _create_asset(self, event, meeting_meta, asset_type):
         name_bits = [self._event_name(event)]
@@ -170,7 +329,7 @@ class Site(base.Site):
             "meeting_date": dtz_to_dt(meeting_time),
             "meeting_time": meeting_time,
             "meeting_id": meeting_id,
-            "scraped_by": f"civic-scraper_{civic_scraper.__version__}",
+            "scraped_by": scraped_by(),
         }
 
     def _event_name(self, event):
@@ -179,15 +338,7 @@ class Site(base.Site):
         except (KeyError, TypeError):
             return event["Name"]
 
-    def _skippable(
-        self,
-        asset,
-        start_date,
-        end_date,
-        file_size=None,
-        download=False,
-        fetch_file_meta=False,
-    ):
+    def _skippable(self, asset, start_date, end_date):
         start = parse_date(start_date)
         end = parse_date(end_date)
         # Use a generic (non-timezone aware) date for filtering
@@ -201,12 +352,4 @@ class Site(base.Site):
         # Skip if meeting date isn't between/equal to start and end dates
         if not start <= meeting_date <= end:
             return True
-        # Add Content Type and Length when download or fetch_file_meta specified
-        if download or fetch_file_meta:
-            self._add_file_meta(asset)
-        # if file_size and download are given, then check byte count
-        if file_size and download:
-            max_bytes = mb_to_bytes(file_size)
-            if float(asset.content_length) > max_bytes:
-                return True
         return False
@@ -2,12 +2,11 @@ import re
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
-from requests import Session
-
-import civic_scraper
 from civic_scraper import base
 from civic_scraper.base.asset import Asset, AssetCollection
 from civic_scraper.base.cache import Cache
+from civic_scraper.base.http import create_session
+from civic_scraper.utils import scraped_by
 
 
 class PrimeGovSite(base.Site):
@@ -27,7 +26,7 @@ class PrimeGovSite(base.Site):
         self.state_or_province = state_or_province
         self.cache = cache if cache is not None else Cache()
 
-        self.session = Session()
+        self.session = create_session()
         self.session.headers["User-Agent"] = (
             "Mozilla/5.0 (X11; CrOS x86_64 12871.102.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/81.0.4044.141 Safari/537.36"
         )
@@ -53,7 +52,7 @@ class PrimeGovSite(base.Site):
             "meeting_date": meeting_datetime.date(),
             "meeting_time": meeting_datetime.time(),
             "meeting_id": meeting_id,
-            "scraped_by": f"civic-scraper_{civic_scraper.__version__}",
+            "scraped_by": scraped_by(),
             "content_type": "html",
             "content_length": None,
         }
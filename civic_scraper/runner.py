@@ -1,9 +1,16 @@
 import importlib
+import inspect
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 from civic_scraper.base.asset import AssetCollection
 from civic_scraper.base.cache import Cache
+from civic_scraper.base.content_store import ContentStore
+from civic_scraper.base.downloader import Downloader
+from civic_scraper.base.manifest import Manifest
+from civic_scraper.base.sinks import open_sink
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +50,14 @@ class Runner:
         download=False,
         timeout=None,
         platform=None,
+        max_workers=1,
+        download_workers=None,
+        max_per_host=2,
+        dedupe=False,
+        output_format="csv",
+        keep_assets=True,
+        fetch_file_meta=None,
+        file_meta_workers=None,
     ):
         """Scrape file metadata and assets for a list of agency sites.
 
@@ -50,6 +65,12 @@ class Runner:
         downloads file artificats. Automatically generats a metadata
         CSV of file assets.
 
+        Metadata is streamed to the metadata file as each site finishes,
+        so results for completed sites are kept even if the run fails
+        later. When downloading, each site's assets are queued on one
+        download pool for the whole run as soon as that site finishes,
+        and the run returns once every queued download is done.
+
         If requested, caches intermediate file artifacts such as HTML
         from scraped pages and downloads file assets such as agendas, minutes
         (caching and downloading are optional and are off by default).
@@ -68,56 +89,187 @@ class Runner:
             platform (str): Force a specific platform for all URLs instead of
                 auto-detecting from the URL. Overrides any per-entry ``platform``
                 value in ``site_urls``. Must be a key in ``PLATFORMS``.
+            max_workers (int): Number of sites to scrape concurrently. Each site
+                runs on its own worker thread, and a failure on one site is logged
+                without interrupting the others (default: 1)
+            download_workers (int): Number of file assets to download concurrently
+                (default: same as ``max_workers``)
+            max_per_host (int): Max number of concurrent downloads from any single
+                host (default: 2)
+            dedupe (bool): Store downloaded files once by content hash and
+                hard-link per-asset file names to the stored copy (default: False)
+            output_format (str): Format of the metadata file, "csv" or "jsonl"
+                (default: csv)
+            keep_assets (bool): Collect assets in memory and return them. Set to
+                False for large sweeps to keep memory use bounded (default: True)
+            fetch_file_meta (bool): Whether sites that support it (e.g. CivicPlus)
+                make a HEAD request per asset for content type and length. When
+                False, content info is filled in on download instead
+                (default: each platform's own default)
+            file_meta_workers (int): Number of those HEAD requests to run
+                concurrently on sites that support it (default: each platform's
+                own default)
 
         Outputs:
-            Metadata CSV listing file assets for given sites and params.
+            Metadata file listing file assets for given sites and params.
 
         Returns:
-            AssetCollection instance
+            AssetCollection instance (empty if ``keep_assets`` is False)
         """
-        site_urls = site_urls or []
         asset_collection = AssetCollection()
         cache_obj = Cache(self.cache_path)
+        sites = self._build_sites(site_urls, start_date, end_date, platform, cache_obj)
+        scrape_kwargs = {
+            "cache": cache,
+            "timeout": timeout,
+            "fetch_file_meta": fetch_file_meta,
+            "file_meta_workers": file_meta_workers,
+        }
+        with self._results(
+            cache_obj,
+            output_format=output_format,
+            download=download,
+            timeout=timeout,
+            download_workers=download_workers or max_workers,
+            max_per_host=max_per_host,
+            dedupe=dedupe,
+        ) as (handle_site_assets, finish_downloads):
+            if max_workers and max_workers > 1 and len(sites) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # map() yields results in input order, so the metadata
+                    # file is identical to a serial run
+                    for assets in executor.map(
+                        lambda site: self._scrape_site(
+                            site, start_date, end_date, **scrape_kwargs
+                        ),
+                        sites,
+                    ):
+                        handle_site_assets(assets)
+                        if keep_assets:
+                            asset_collection.extend(assets)
+            else:
+                for site in sites:
+                    assets = self._scrape_site(
+                        site, start_date, end_date, **scrape_kwargs
+                    )
+                    handle_site_assets(assets)
+                    if keep_assets:
+                        asset_collection.extend(assets)
+            finish_downloads()
+        return asset_collection
+
+    @contextmanager
+    def _results(
+        self,
+        cache_obj,
+        output_format="csv",
+        download=False,
+        timeout=None,
+        download_workers=1,
+        max_per_host=2,
+        dedupe=False,
+    ):
+        """Yield callables that persist each site's assets as it finishes.
+
+        ``handle_site_assets`` appends a site's assets to the metadata
+        file right away and, if requested, queues them on a Downloader
+        pool shared by the whole run without waiting for them, so a slow
+        download never holds up metadata or downloads for other sites.
+        ``finish_downloads`` waits for every queued download and reports
+        failures once all sites are handled.
+        """
+        sink = open_sink(cache_obj.metadata_files_path, output_format)
+        downloader = None
+        if download:
+            downloader = Downloader(
+                cache_obj.assets_path,
+                max_workers=download_workers,
+                max_per_host=max_per_host,
+                timeout=timeout,
+                manifest=Manifest(cache_obj.download_manifest_path),
+                store=ContentStore(cache_obj.asset_objects_path) if dedupe else None,
+            )
+
+        def handle_site_assets(assets):
+            sink.write(assets)
+            if downloader is not None and assets:
+                logger.info(f"Queued {len(assets)} file asset(s) for download")
+                downloader.submit(assets)
+
+        def finish_downloads():
+            if downloader is not None:
+                self._finish_downloads(downloader, cache_obj.assets_path)
+
+        try:
+            yield handle_site_assets, finish_downloads
+        finally:
+            sink.close()
+            if downloader is not None:
+                downloader.close()
+        logger.info(f"Wrote metadata for {sink.count} asset(s): {sink.path}")
+
+    def _finish_downloads(self, downloader, assets_path):
+        logger.info(f"Waiting for file asset downloads to {assets_path}...")
+        downloaded, failed = downloader.wait()
+        logger.info(f"Downloaded {downloaded} file asset(s)")
+        if failed:
+            logger.warning(f"Failed to download {len(failed)} file asset(s):")
+            for asset, error in failed:
+                logger.warning(f"\t{asset.url} ({error})")
+
+    def _build_sites(self, site_urls, start_date, end_date, platform, cache_obj):
+        site_urls = site_urls or []
         logger.info(
             f"Scraping {len(site_urls)} site(s) from {start_date} to {end_date}..."
         )
-        for entry in site_urls:
-            if isinstance(entry, dict):
-                url = entry.get("url")
-                if not url:
-                    raise ScraperError(
-                        "site_urls entries must be URL strings or dicts with a non-empty 'url' key"
-                    )
-                effective_platform = platform or entry.get("platform") or None
-            else:
-                url = entry
-                effective_platform = platform
-            SiteClass = self._get_site_class(url, platform=effective_platform)
-            kwargs = {}
-            if cache:
-                kwargs["cache"] = cache_obj
-            site = SiteClass(url, **kwargs)
-            logger.info(f"\t{url}")
-            _collection = site.scrape(
+        return [self._build_site(entry, platform, cache_obj) for entry in site_urls]
+
+    def _build_site(self, entry, platform, cache_obj):
+        if isinstance(entry, dict):
+            url = entry.get("url")
+            if not url:
+                raise ScraperError(
+                    "site_urls entries must be URL strings or dicts with a non-empty 'url' key"
+                )
+            effective_platform = platform or entry.get("platform") or None
+        else:
+            url = entry
+            effective_platform = platform
+        SiteClass = self._get_site_class(url, platform=effective_platform)
+        # Sites always get the run's cache, so state such as feed manifests
+        # lands under cache_path. The cache flag passed to scrape controls
+        # whether intermediate artifacts are written.
+        return SiteClass(url, cache=cache_obj)
+
+    def _scrape_site(
+        self, site, start_date, end_date, cache=False, timeout=None, **options
+    ):
+        logger.info(f"\t{site.url}")
+        try:
+            return site.scrape(
                 start_date,
                 end_date,
                 cache=cache,
                 timeout=timeout,
+                **self._scrape_options(site, **options),
             )
-            asset_collection.extend(_collection)
-        metadata_file = asset_collection.to_csv(cache_obj.metadata_files_path)
-        logger.info(f"Wrote asset metadata CSV: {metadata_file}")
-        if download:
-            download_counter = 0
-            logger.info(
-                f"Downloading {len(asset_collection)} file asset(s) to {cache_obj.assets_path}..."
-            )
-            for asset in asset_collection:
-                # TODO: Add error-handling here
-                logger.info(f"\t{asset.url}")
-                asset.download(cache_obj.assets_path, timeout=timeout)
-                download_counter += 1
-        return asset_collection
+        except Exception:
+            logger.exception(f"Failed to scrape {site.url}")
+            return []
+
+    def _scrape_options(self, site, **options):
+        """Return the options that were set and that ``site.scrape`` accepts.
+
+        Platform scrapers take different keyword arguments, so an option
+        such as ``file_meta_workers`` only goes to sites that support it and
+        unset options leave each platform's own default in place.
+        """
+        params = inspect.signature(site.scrape).parameters
+        return {
+            name: value
+            for name, value in options.items()
+            if value is not None and name in params
+        }
 
     def _get_site_class(self, url, platform=None):
         class_name = self._get_site_class_name(url, platform=platform)
@@ -1,6 +1,9 @@
 from datetime import datetime
+from functools import lru_cache
 from os.path import expanduser, join
 
+import civic_scraper
+
 
 def today_local_str():
     return datetime.now().strftime("%Y-%m-%d")
@@ -22,3 +25,9 @@ def mb_to_bytes(size_mb):
     if size_mb is None:
         return None
     return float(size_mb) * 1048576
+
+
+@lru_cache(maxsize=None)
+def scraped_by():
+    "Value for Asset.scraped_by, computed once per process"
+    return f"civic-scraper_{civic_scraper.__version__}"
@@ -1,6 +1,7 @@
 import csv
 import datetime
 import os
+import time
 from pathlib import Path
 
 import pytest
@@ -18,6 +19,24 @@ import pytest
 # vcr_log.setLevel(logging.INFO)
 
 
+# Timing benchmarks are noisy on loaded or parallel CI runners, so they
+# only run when CIVIC_SCRAPER_BENCHMARKS is set
+benchmark = pytest.mark.skipif(
+    not os.environ.get("CIVIC_SCRAPER_BENCHMARKS"),
+    reason="set CIVIC_SCRAPER_BENCHMARKS=1 to run timing benchmarks",
+)
+
+
+def best_of(func, runs=5):
+    "Return the fastest of several timed calls to func, in seconds"
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
 @pytest.fixture(autouse=True)
 def _no_sleep(monkeypatch):
     """Skip time.sleep() during tests so VCR replays don't wait."""
@@ -78,6 +97,28 @@ def csv_rows(pth):
         return [row for row in csv.DictReader(source)]
 
 
+class FakeResponse:
+    "Minimal stand-in for a streamed requests.Response"
+
+    def __init__(self, chunks, status_code=200, headers=None, fail_after=None):
+        self.chunks = chunks
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.fail_after = fail_after
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise ConnectionError("connection reset")
+            yield chunk
+
+    def close(self):
+        pass
+
+
 @pytest.fixture(scope="session")
 def search_results_html():
     return read_fixture("civplus_agenda_search_results_page.html")
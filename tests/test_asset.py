@@ -1,11 +1,15 @@
+import hashlib
 import re
+import threading
 from unittest.mock import Mock, call, patch
 
 import pytest
 
 from civic_scraper.base.asset import Asset, AssetCollection
+from civic_scraper.base.downloader import Downloader
+from civic_scraper.base.manifest import Manifest
 
-from .conftest import file_lines
+from .conftest import FakeResponse, file_lines
 
 
 def test_asset_args(asset_inputs):
@@ -52,7 +56,7 @@ def test_csv_export(tmpdir, asset_collection):
 
 def test_asset_download(tmpdir, asset_inputs):
     response = Mock(name="MockResponse")
-    response.content = b"some data"
+    response.iter_content.return_value = [b"some ", b"data"]
     to_patch = "civic_scraper.base.asset.requests.get"
     with patch(to_patch) as mock_method:
         mock_method.return_value = response
@@ -64,11 +68,13 @@ def test_asset_download(tmpdir, asset_inputs):
                 "http://nc-nashcounty.civicplus.com/AgendaCenter/ViewFile/Minutes/_05042020-381",
                 allow_redirects=True,
                 timeout=None,
+                stream=True,
             ),
             call(
                 "http://nc-nashcounty.civicplus.com/AgendaCenter/ViewFile/Agenda/_05042020-381",
                 allow_redirects=True,
                 timeout=None,
+                stream=True,
             ),
         ]
 
@@ -76,7 +82,7 @@ def test_asset_download(tmpdir, asset_inputs):
 def test_asset_download_timeout(tmpdir, asset_inputs):
     "download() should pass timeout to requests.get"
     response = Mock(name="MockResponse")
-    response.content = b"some data"
+    response.iter_content.return_value = [b"some ", b"data"]
     to_patch = "civic_scraper.base.asset.requests.get"
     with patch(to_patch) as mock_method:
         mock_method.return_value = response
@@ -84,3 +90,204 @@ def test_asset_download_timeout(tmpdir, asset_inputs):
         asset.download(target_dir=tmpdir, timeout=5)
         _, _, call_kwargs = mock_method.mock_calls[0]
         assert call_kwargs["timeout"] == 5
+
+
+def test_asset_download_streams_to_file(tmpdir, asset_inputs):
+    "download() should write streamed chunks and leave no partial file behind"
+    response = Mock(name="MockResponse")
+    response.iter_content.return_value = [b"some ", b"data"]
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = response
+        asset = Asset(**asset_inputs[0])
+        outfile = asset.download(target_dir=tmpdir)
+    assert file_lines(outfile) == ["some data"]
+    assert [f.basename for f in tmpdir.listdir()] == [asset._file_name()]
+    response.close.assert_called_once()
+
+
+def test_asset_download_interrupted(tmpdir, asset_inputs):
+    "An interrupted download should not leave a file under the final name"
+
+    def broken_stream(chunk_size):
+        yield b"some "
+        raise ConnectionError("connection reset")
+
+    response = Mock(name="MockResponse")
+    response.iter_content.side_effect = broken_stream
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = response
+        asset = Asset(**asset_inputs[0])
+        with pytest.raises(ConnectionError):
+            asset.download(target_dir=tmpdir)
+    assert tmpdir.listdir() == []
+
+
+RESUMABLE_HEADERS = {
+    "accept-ranges": "bytes",
+    "content-length": "10",
+    "etag": '"abc123"',
+}
+
+
+def test_asset_download_resumes_with_range(tmpdir, asset_inputs):
+    "An interrupted download should resume from the partial file via Range"
+    asset = Asset(**asset_inputs[0])
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse(
+            [b"01234", b"56789"], headers=RESUMABLE_HEADERS, fail_after=1
+        )
+        with pytest.raises(ConnectionError):
+            asset.download(target_dir=tmpdir)
+        partials = sorted(f.basename for f in tmpdir.listdir())
+        part_name = asset._part_name()
+        assert part_name.startswith("civicplus_nc-nashcounty_05042020-381_minutes_")
+        assert partials == [part_name, f"{part_name}.json"]
+        mock_method.return_value = FakeResponse(
+            [b"56789"],
+            status_code=206,
+            headers={"content-range": "bytes 5-9/10", "etag": '"abc123"'},
+        )
+        outfile = asset.download(target_dir=tmpdir)
+        _, kwargs = mock_method.call_args
+        assert kwargs["headers"] == {"Range": "bytes=5-", "If-Range": '"abc123"'}
+    assert file_lines(outfile) == ["0123456789"]
+    assert [f.basename for f in tmpdir.listdir()] == [asset._file_name()]
+
+
+def test_asset_download_range_ignored(tmpdir, asset_inputs):
+    "A full response to a Range request should replace the partial file"
+    asset = Asset(**asset_inputs[0])
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse(
+            [b"01234", b"56789"], headers=RESUMABLE_HEADERS, fail_after=1
+        )
+        with pytest.raises(ConnectionError):
+            asset.download(target_dir=tmpdir)
+        mock_method.return_value = FakeResponse(
+            [b"abcde", b"fghij"], headers=RESUMABLE_HEADERS
+        )
+        outfile = asset.download(target_dir=tmpdir)
+    assert file_lines(outfile) == ["abcdefghij"]
+
+
+def test_asset_download_records_manifest(tmpdir, asset_inputs):
+    "Downloads should record validators, size and hash in the manifest"
+    manifest = Manifest(tmpdir.join("manifests", "downloads.json"))
+    asset = Asset(**asset_inputs[0])
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse(
+            [b"some data"], headers={"etag": '"v1"'}
+        )
+        outfile = asset.download(target_dir=tmpdir, manifest=manifest)
+    assert manifest.get(asset.url) == {
+        "path": outfile,
+        "content_length": 9,
+        "sha256": hashlib.sha256(b"some data").hexdigest(),
+        "etag": '"v1"',
+        "last_modified": None,
+    }
+
+
+def test_asset_download_not_modified(tmpdir, asset_inputs):
+    "A 304 response should keep the previously downloaded file"
+    manifest = Manifest(tmpdir.join("manifests", "downloads.json"))
+    asset = Asset(**asset_inputs[0])
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse(
+            [b"some data"], headers={"etag": '"v1"'}
+        )
+        outfile = asset.download(target_dir=tmpdir, manifest=manifest)
+        mock_method.return_value = FakeResponse([b"new data"], status_code=304)
+        assert asset.download(target_dir=tmpdir, manifest=manifest) == outfile
+        _, kwargs = mock_method.call_args
+    assert kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert file_lines(outfile) == ["some data"]
+
+
+def test_asset_download_refetches_changed_file(tmpdir, asset_inputs):
+    "A file whose bytes no longer match the manifest should not be revalidated"
+    manifest = Manifest(tmpdir.join("manifests", "downloads.json"))
+    asset = Asset(**asset_inputs[0])
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse(
+            [b"some data"], headers={"etag": '"v1"'}
+        )
+        outfile = asset.download(target_dir=tmpdir, manifest=manifest)
+        # Same size, different bytes
+        with open(outfile, "w") as fh:
+            fh.write("other doc")
+        mock_method.return_value = FakeResponse(
+            [b"some data"], headers={"etag": '"v1"'}
+        )
+        assert asset.download(target_dir=tmpdir, manifest=manifest) == outfile
+        _, kwargs = mock_method.call_args
+    assert "headers" not in kwargs
+    assert file_lines(outfile) == ["some data"]
+
+
+def test_asset_download_skips_unchanged_without_validators(tmpdir, asset_inputs):
+    "Files without validators should be skipped when size and hash match"
+    manifest = Manifest(tmpdir.join("manifests", "downloads.json"))
+    asset = Asset(**asset_inputs[0])
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse([b"some data"])
+        outfile = asset.download(target_dir=tmpdir, manifest=manifest)
+        assert asset.download(target_dir=tmpdir, manifest=manifest) == outfile
+    assert mock_method.call_count == 1
+
+
+def test_asset_download_fills_content_info(tmpdir, asset_inputs):
+    "Missing content info should be filled from the download response"
+    kwargs = dict(asset_inputs[0], content_type=None, content_length=None)
+    asset = Asset(**kwargs)
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = FakeResponse(
+            [b"some data"], headers={"content-type": "application/pdf"}
+        )
+        outfile = asset.download(target_dir=tmpdir)
+    assert outfile.endswith(asset._file_name())
+    assert asset.content_type == "application/pdf"
+    assert asset.content_length == "9"
+
+
+def test_asset_download_concurrent_same_file_stem(tmpdir, asset_inputs):
+    "Assets sharing a meeting id and type should each keep their own file"
+    assets = []
+    for i in range(2):
+        kwargs = dict(asset_inputs[0], meeting_id=None, url=f"https://a.gov/{i}.pdf")
+        assets.append(Asset(**kwargs))
+    assert assets[0]._part_name() != assets[1]._part_name()
+    assert assets[0]._file_name() != assets[1]._file_name()
+    # Both downloads must have opened their partial files to get past this
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowResponse(FakeResponse):
+        def iter_content(self, chunk_size):
+            yield self.chunks[0]
+            barrier.wait()
+            yield from self.chunks[1:]
+
+    def get(url, **kwargs):
+        body = url.rsplit("/", 1)[-1].encode()
+        return SlowResponse([body, body])
+
+    downloader = Downloader(str(tmpdir), max_workers=2)
+    with patch("requests.Session.get", side_effect=get):
+        downloaded, failed = downloader.download(assets)
+    downloader.close()
+    assert downloaded == 2
+    assert not failed
+    # Every downloaded document is on disk with its own bytes
+    for i, asset in enumerate(assets):
+        with open(tmpdir.join(asset._file_name())) as fh:
+            assert fh.read() == f"{i}.pdf{i}.pdf"
+    assert len(tmpdir.listdir()) == 2
@@ -0,0 +1,189 @@
+import datetime
+import threading
+from unittest.mock import MagicMock, patch
+
+import demjson3 as demjson
+import lxml.html
+
+from civic_scraper.platforms import CivicClerkSite
+from civic_scraper.platforms.civic_clerk.site import (
+    EVENT_COMMITTEE_TEXT,
+    EVENT_DATETIME_TEXT,
+    EVENT_LINK,
+    PAST_EVENT_ROWS,
+    decode_js,
+    encode_js,
+)
+
+from .conftest import benchmark, best_of
+
+PAST_TABLE_ID = "aspxroundpanelRecent2_ASPxPanel4_grdEventsRecent2_DXMainTable"
+
+
+def _row_html(event_id, day):
+    return (
+        '<tr class="dxgvDataRow_CustomThemeModerno">'
+        f'<td id="row_3"><a href="javascript:ShowEvent({event_id}, 1)">x</a>'
+        "City Council</td>"
+        f'<td id="row_4">01/{day:02d}/2026 6:00 PM</td>'
+        "</tr>"
+    )
+
+
+def _event_row(event_id, day):
+    html = f"<table>{_row_html(event_id, day)}</table>"
+    return lxml.html.fromstring(html).xpath("//tr")[0]
+
+
+def _past_page(*rows):
+    body = "".join(_row_html(event_id, day) for event_id, day in rows)
+    html = f'<html><table id="{PAST_TABLE_ID}">{body}</table></html>'
+    return lxml.html.fromstring(html)
+
+
+def _response(text):
+    return MagicMock(text=text)
+
+
+def test_scrape_fetches_events_concurrently_in_order():
+    "Event detail pages should be fetched in parallel and assets kept in order"
+    site = CivicClerkSite("https://town.civicclerk.com/web/home.aspx")
+    # The first two detail fetches must be in flight at once to get past this
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get(url, **kwargs):
+        if "DocumentFrame" in url:
+            event_id = url.split("id=")[1].split("&")[0]
+            if event_id != "3":
+                barrier.wait()
+            return _response(
+                f'<html><iframe id="docViewer" src="/Web/Frame?id={event_id}"></iframe></html>'
+            )
+        return _response("<html><p>Agenda</p></html>")
+
+    rows = [_event_row(1, 20), _event_row(2, 13), _event_row(3, 6)]
+    with (
+        patch.object(site, "events", return_value=iter(rows)),
+        patch.object(site.session, "get", side_effect=get),
+    ):
+        assets = site.scrape(download=False, max_workers=3)
+    assert [asset.url for asset in assets] == [
+        "https://town.civicclerk.com/Web/Frame?id=1",
+        "https://town.civicclerk.com/Web/Frame?id=2",
+        "https://town.civicclerk.com/Web/Frame?id=3",
+    ]
+    assert [asset.meeting_id for asset in assets] == [
+        "civicclerk_town_1",
+        "civicclerk_town_2",
+        "civicclerk_town_3",
+    ]
+
+
+def test_past_events_stop_at_start_date():
+    "Pagination should stop after the first page reaching events before start_date"
+    site = CivicClerkSite("https://town.civicclerk.com/web/home.aspx")
+    pages = [
+        _past_page((5, 28), (4, 21)),
+        _past_page((3, 14), (2, 7)),
+        _past_page((1, 2)),
+    ]
+    served = []
+
+    def paginate(callback_id):
+        for page in pages:
+            served.append(page)
+            yield page
+
+    with patch.object(site, "_paginate", side_effect=paginate):
+        events = list(site._past_events(datetime.date(2026, 1, 10)))
+    assert len(served) == 2
+    assert [site.get_meeting_id(event)[0] for event in events] == [
+        "5",
+        "4",
+        "3",
+        "2",
+    ]
+
+
+def test_scrape_skips_events_outside_date_range():
+    "Detail pages should only be fetched for events within the date range"
+    site = CivicClerkSite("https://town.civicclerk.com/web/home.aspx")
+    rows = [_event_row(1, 20), _event_row(2, 13), _event_row(3, 6)]
+    with (
+        patch.object(site, "events", return_value=iter(rows)),
+        patch.object(
+            site, "_fetch_agenda_items", return_value=[("https://a.gov/doc", "Agenda")]
+        ) as fetch,
+    ):
+        assets = site.scrape("2026-01-10", "2026-01-15")
+    assert [meta[2] for (meta,), _ in fetch.call_args_list] == ["2"]
+    assert [asset.meeting_id for asset in assets] == ["civicclerk_town_2"]
+
+
+def _callback_payload(rows=200):
+    "A DevExpress grid callback body shaped like those CivicClerk returns"
+    keys = ",".join(f"'{1000 + i}'" for i in range(rows))
+    html = "".join(
+        _row_html(1000 + i, i % 28 + 1).replace("'", "\\'") for i in range(rows)
+    )
+    return (
+        "{'id':1,'result':{'stateObject':{'keys':[" + keys + "],"
+        "'callbackState':'" + "AbCdEf0123/+=" * 200 + "',"
+        "'groupLevelState':{},'selection':'','toolbar':null,'focusedRow':-1},"
+        "'html':'" + html + "'}}"
+    )
+
+
+def test_decode_js_matches_demjson():
+    payload = _callback_payload(rows=20)
+    assert decode_js(payload) == demjson.decode(payload)
+    state = decode_js(payload)["result"]["stateObject"]
+    assert encode_js(state) == demjson.encode(state)
+
+
+def test_decode_js_falls_back_to_demjson():
+    assert decode_js("{'name':'\\x41', 'missing': undefined}")["name"] == "A"
+
+
+@benchmark
+def test_decode_js_benchmark():
+    "The json fast path should be much faster than demjson on large payloads"
+    payload = _callback_payload()
+
+    fast = best_of(lambda: decode_js(payload), runs=3)
+    slow = best_of(lambda: demjson.decode(payload), runs=3)
+    assert fast * 5 < slow
+
+
+EVENT_EXPRESSIONS = [
+    (EVENT_LINK, "./td[contains(@id, '_3')]//a"),
+    (EVENT_COMMITTEE_TEXT, "./td[contains(@id, '_3')]//text()"),
+    (EVENT_DATETIME_TEXT, "./td[contains(@id, '_4')]//text()"),
+]
+
+
+def test_event_xpath_matches_string_expressions():
+    "Precompiled XPath should select the same nodes as the string expressions"
+    rows = PAST_EVENT_ROWS(_past_page(*[(i, i % 28 + 1) for i in range(20)]))
+    assert len(rows) == 20
+    for row in rows:
+        for compiled, source in EVENT_EXPRESSIONS:
+            assert compiled(row) == row.xpath(source)
+
+
+@benchmark
+def test_event_xpath_benchmark():
+    "Precompiled XPath should cost less per event row than string expressions"
+    rows = PAST_EVENT_ROWS(_past_page(*[(i, i % 28 + 1) for i in range(500)]))
+
+    def per_row(evaluate):
+        def run():
+            for row in rows:
+                for compiled, source in EVENT_EXPRESSIONS:
+                    evaluate(row, compiled, source)
+
+        return best_of(run) / len(rows)
+
+    before = per_row(lambda row, compiled, source: row.xpath(source))
+    after = per_row(lambda row, compiled, source: compiled(row))
+    assert after < before
@@ -1,8 +1,15 @@
+import re
 from datetime import datetime
 
-from civic_scraper.platforms.civic_plus.parser import Parser
+import pytest
 
-from .conftest import read_fixture
+from civic_scraper.platforms.civic_plus.parser import (
+    MEETING_NAME_DATE_RE,
+    LxmlParser,
+    Parser,
+)
+
+from .conftest import benchmark, best_of, read_fixture
 
 
 def test_parse_all(search_results_html):
@@ -56,3 +63,34 @@ def test_parse_alameda():
     assert first["meeting_title"] == "Agenda"
     assert first["meeting_id"] == "_09042024-1447"
     assert first["asset_type"] == "agenda"
+
+
+MEETING_NAMES = [f"_{i % 12 + 1:02d}{i % 28 + 1:02d}2020-{i}" for i in range(50)]
+MEETING_NAME_DATE_PATTERN = r"_(\d{2})(\d{2})(\d{4}).+"
+
+
+def test_meeting_date_regex_matches_pattern():
+    "The precompiled regex should match like re.match on the original pattern"
+    for name in MEETING_NAMES + ["Agenda", "_0904-1447"]:
+        expected = re.match(MEETING_NAME_DATE_PATTERN, name)
+        actual = MEETING_NAME_DATE_RE.match(name)
+        assert (actual and actual.groups()) == (expected and expected.groups())
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["civplus_agenda_search_results_page.html", "civplus_alameda_water.html"],
+)
+def test_lxml_parser_matches_parser(fixture):
+    "LxmlParser should extract exactly the same metadata as Parser"
+    html = read_fixture(fixture)
+    assert LxmlParser(html).parse() == Parser(html).parse()
+
+
+@benchmark
+def test_lxml_parser_benchmark(search_results_html):
+    "LxmlParser should parse search results pages faster than Parser"
+
+    before = best_of(lambda: Parser(search_results_html).parse(), runs=3)
+    after = best_of(lambda: LxmlParser(search_results_html).parse(), runs=3)
+    assert after < before
@@ -4,11 +4,25 @@ from unittest.mock import patch
 import pytest
 
 import civic_scraper
+from civic_scraper.base.asset import Asset
 from civic_scraper.base.cache import Cache
 from civic_scraper.platforms import CivicPlusSite
 
 from .conftest import file_contents
 
+NASH_FILES_URL = "http://nc-nashcounty.civicplus.com/AgendaCenter/ViewFile"
+
+
+def _nash_file_name(asset_type, meeting="05052020-382"):
+    "Name a downloaded Nash County asset is saved under"
+    asset = Asset(
+        f"{NASH_FILES_URL}/{asset_type.title()}/_{meeting}",
+        meeting_id=f"civicplus_nc-nashcounty_{meeting}",
+        asset_type=asset_type,
+        content_type="application/pdf",
+    )
+    return asset._file_name()
+
 
 @pytest.mark.vcr()
 def test_scrape_defaults():
@@ -149,8 +163,8 @@ def test_scrape_download_true(tmpdir):
     target_dir = tmpdir.join("assets")
     actual_files = {f.basename for f in target_dir.listdir()}
     expected = {
-        "civicplus_nc-nashcounty_05052020-382_minutes.pdf",
-        "civicplus_nc-nashcounty_05052020-382_agenda.pdf",
+        _nash_file_name("minutes"),
+        _nash_file_name("agenda"),
     }
     assert actual_files == expected
 
@@ -174,7 +188,7 @@ def test_scrape_download_filter_size(tmpdir):
     )
     target_dir = tmpdir.join("assets")
     actual_files = [f.basename for f in target_dir.listdir()]
-    expected = ["civicplus_nc-nashcounty_05052020-382_agenda.pdf"]
+    expected = [_nash_file_name("agenda")]
     assert actual_files == expected
 
 
@@ -193,7 +207,7 @@ def test_scrape_download_filter_type(tmpdir):
     )
     target_dir = tmpdir.join("assets")
     actual_files = [f.basename for f in target_dir.listdir()]
-    expected = ["civicplus_nc-nashcounty_05052020-382_agenda.pdf"]
+    expected = [_nash_file_name("agenda")]
     assert actual_files == expected
 
 
@@ -243,7 +257,49 @@ def test_scrape_current_day_by_default(today_local_str, tmpdir):
     target_dir = tmpdir.join("assets")
     actual_files = {f.basename for f in target_dir.listdir()}
     expected = {
-        "civicplus_nc-nashcounty_05052020-382_minutes.pdf",
-        "civicplus_nc-nashcounty_05052020-382_agenda.pdf",
+        _nash_file_name("minutes"),
+        _nash_file_name("agenda"),
     }
     assert actual_files == expected
+
+
+def test_scrape_without_file_meta(search_results_html):
+    "fetch_file_meta=False should skip HEAD requests for each asset"
+    url = "http://nc-nashcounty.civicplus.com/AgendaCenter"
+    cp = CivicPlusSite(url)
+    with patch.object(cp, "_search", return_value=(url, search_results_html)):
+        with patch.object(cp.session, "head") as mock_head:
+            assets = cp.scrape("2020-05-03", "2020-05-06", fetch_file_meta=False)
+    mock_head.assert_not_called()
+    assert len(assets) > 0
+    assert all(asset.content_type is None for asset in assets)
+    assert all(asset.content_length is None for asset in assets)
+
+
+def test_scrape_file_meta_concurrently(search_results_html):
+    "file_meta_workers should populate content info for every asset"
+    url = "http://nc-nashcounty.civicplus.com/AgendaCenter"
+    cp = CivicPlusSite(url)
+    with patch.object(cp, "_search", return_value=(url, search_results_html)):
+        with patch.object(cp.session, "head") as mock_head:
+            mock_head.return_value.headers = {
+                "content-type": "application/pdf",
+                "content-length": "100",
+            }
+            assets = cp.scrape("2020-05-03", "2020-05-06", file_meta_workers=4)
+    assert mock_head.call_count == len(assets)
+    assert all(asset.content_type == "application/pdf" for asset in assets)
+
+
+def test_scrape_download_filter_size_unknown_length(search_results_html, tmpdir):
+    "Assets whose HEAD request failed should be downloaded despite file_size"
+    url = "http://nc-nashcounty.civicplus.com/AgendaCenter"
+    cp = CivicPlusSite(url, cache=Cache(tmpdir))
+    with patch.object(cp, "_search", return_value=(url, search_results_html)):
+        with patch.object(cp.session, "head", side_effect=ConnectionError):
+            with patch.object(Asset, "download") as mock_download:
+                assets = cp.scrape(
+                    "2020-05-03", "2020-05-06", download=True, file_size=0.05
+                )
+    assert all(asset.content_length is None for asset in assets)
+    assert mock_download.call_count == len(assets)
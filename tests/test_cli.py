@@ -101,6 +101,7 @@ def test_cli_store_csv_urls(runner_class, civic_scraper_dir):
         "cache": True,
         "download": True,
         "timeout": None,
+        "keep_assets": False,
         "site_urls": [
             "http://nc-nashcounty.civicplus.com/AgendaCenter",
             "https://wi-columbus.civicplus.com/AgendaCenter",
@@ -184,3 +185,89 @@ def test_cli_csv_platform_column(runner_class, civic_scraper_dir):
             "platform": "civic-plus",
         },
     ]
+
+
+@patch("civic_scraper.cli.Runner")
+@pytest.mark.usefixtures("set_default_env")
+def test_cli_workers_option(runner_class, civic_scraper_dir):
+    "CLI --workers and --download-workers should be passed through to Runner.scrape"
+    cli_runner = CliRunner()
+    cli_runner.invoke(
+        cli.cli,
+        [
+            "scrape",
+            "--workers",
+            "8",
+            "--download-workers",
+            "16",
+            "--urls-file",
+            path_to_test_dir_file("fixtures/url_input.csv"),
+        ],
+    )
+    runner_instance = runner_class.return_value
+    _, _, kwargs = runner_instance.scrape.mock_calls[0]
+    assert kwargs["max_workers"] == 8
+    assert kwargs["download_workers"] == 16
+
+
+@patch("civic_scraper.cli.Runner")
+@pytest.mark.usefixtures("set_default_env")
+def test_cli_rate_limit_option(runner_class, civic_scraper_dir):
+    "CLI --rate-limit should configure the shared per-host rate limiter"
+    cli_runner = CliRunner()
+    with patch("civic_scraper.cli.rate_limiter") as limiter:
+        cli_runner.invoke(
+            cli.cli,
+            [
+                "scrape",
+                "--rate-limit",
+                "0.5",
+                "--rate-burst",
+                "3",
+                "--url",
+                "http://nc-nashcounty.civicplus.com/AgendaCenter",
+            ],
+        )
+    limiter.configure.assert_called_once_with(0.5, 3)
+
+
+@patch("civic_scraper.cli.Runner")
+@pytest.mark.usefixtures("set_default_env")
+def test_cli_metadata_format_option(runner_class, civic_scraper_dir):
+    "CLI --metadata-format should be passed to Runner.scrape as output_format"
+    cli_runner = CliRunner()
+    cli_runner.invoke(
+        cli.cli,
+        [
+            "scrape",
+            "--metadata-format",
+            "jsonl",
+            "--url",
+            "http://nc-nashcounty.civicplus.com/AgendaCenter",
+        ],
+    )
+    runner_instance = runner_class.return_value
+    _, _, kwargs = runner_instance.scrape.mock_calls[0]
+    assert kwargs["output_format"] == "jsonl"
+
+
+@patch("civic_scraper.cli.Runner")
+@pytest.mark.usefixtures("set_default_env")
+def test_cli_file_meta_options(runner_class, civic_scraper_dir):
+    "CLI --no-file-meta and --file-meta-workers should be passed to Runner.scrape"
+    cli_runner = CliRunner()
+    cli_runner.invoke(
+        cli.cli,
+        [
+            "scrape",
+            "--no-file-meta",
+            "--file-meta-workers",
+            "4",
+            "--url",
+            "http://nc-nashcounty.civicplus.com/AgendaCenter",
+        ],
+    )
+    runner_instance = runner_class.return_value
+    _, _, kwargs = runner_instance.scrape.mock_calls[0]
+    assert kwargs["fetch_file_meta"] is False
+    assert kwargs["file_meta_workers"] == 4
@@ -0,0 +1,74 @@
+import hashlib
+import os
+import threading
+from unittest.mock import patch
+
+from civic_scraper.base.asset import Asset
+from civic_scraper.base.content_store import ContentStore
+
+from .conftest import FakeResponse
+
+
+def test_store_links_duplicates(tmpdir):
+    "Identical files should share a single stored object"
+    store = ContentStore(tmpdir.join("objects"))
+    digest = hashlib.sha256(b"same").hexdigest()
+    first, second = tmpdir.join("a.pdf"), tmpdir.join("b.pdf")
+    first.write_binary(b"same")
+    second.write_binary(b"same")
+    assert store.add(str(first), digest) is False
+    assert digest in store
+    assert store.add(str(second), digest) is True
+    obj_path = store.object_path(digest)
+    assert os.path.samefile(str(first), obj_path)
+    assert os.path.samefile(str(second), obj_path)
+    assert second.read_binary() == b"same"
+
+
+def test_asset_download_dedupes(tmpdir, asset_inputs):
+    "Assets with identical content should be stored once"
+    store = ContentStore(tmpdir.join("objects"))
+    to_patch = "civic_scraper.base.asset.requests.get"
+    paths = []
+    with patch(to_patch) as mock_method:
+        for kwargs in asset_inputs:
+            mock_method.return_value = FakeResponse([b"same packet"])
+            paths.append(Asset(**kwargs).download(target_dir=tmpdir, store=store))
+    assert os.path.samefile(*paths)
+    assert os.stat(paths[0]).st_nlink == 3
+
+
+def test_concurrent_downloads_store_matching_objects(tmpdir, asset_inputs):
+    "Stored objects should hold the bytes their hash names, under concurrency"
+    # Both downloads must have finished writing before either is stored
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowStore(ContentStore):
+        def add(self, path, sha256):
+            barrier.wait()
+            return super().add(path, sha256)
+
+    store = SlowStore(tmpdir.join("objects"))
+    assets = [
+        Asset(**dict(asset_inputs[0], meeting_id=None, url=f"https://a.gov/{i}"))
+        for i in range(2)
+    ]
+    target_dir = str(tmpdir.join("assets"))
+    to_patch = "civic_scraper.base.asset.requests.get"
+    with patch(
+        to_patch, side_effect=lambda url, **kwargs: FakeResponse([url.encode()])
+    ):
+        threads = [
+            threading.Thread(
+                target=asset.download, args=(target_dir,), kwargs={"store": store}
+            )
+            for asset in assets
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    objects = [path for path in tmpdir.join("objects").visit() if path.isfile()]
+    assert len(objects) == 2
+    for path in objects:
+        assert hashlib.sha256(path.read_binary()).hexdigest() == path.basename
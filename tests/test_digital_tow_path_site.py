@@ -4,9 +4,13 @@ Tests for DTP scraper
 Run with: pipenv run pytest -sv tests/test_digital_tow_path_site.py
 """
 
+import datetime
+import threading
+from unittest.mock import patch
+
 import pytest
 
-from civic_scraper.platforms.digital_tow_path import DigitalTowPathSite
+from civic_scraper.platforms.digital_tow_path import DigitalTowPathSite, utils
 
 
 @pytest.mark.vcr()
@@ -41,3 +45,84 @@ def test_site_initialization():
 def test_site_initialization_does_not_require_known_domain():
     site = DigitalTowPathSite("https://example.com/meetings")
     assert site.base_url == "https://example.com/meetings"
+
+
+def test_scrape_skips_out_of_range_years_and_meetings():
+    "Year pages and detail pages outside the date range should not be fetched"
+    base = "https://finetownny.gov/meetings/meetings/Town%20Board"
+    meetings = {
+        f"{base}/2026": [
+            {"title": "February 11, 2026: Regular", "url": "d/30", "detail_id": "30"},
+            {"title": "January 14, 2026: Regular", "url": "d/29", "detail_id": "29"},
+        ],
+        f"{base}/2025": [
+            {"title": "December 10, 2025: Regular", "url": "d/28", "detail_id": "28"},
+        ],
+    }
+    years = [
+        {"year": "2025", "url": f"{base}/2025"},
+        {"year": "2024", "url": f"{base}/2024"},
+    ]
+    site = DigitalTowPathSite("https://finetownny.gov/categories/")
+    to_patch = "civic_scraper.platforms.digital_tow_path.site.utils"
+    with (
+        patch(to_patch) as utils_mock,
+        patch("civic_scraper.platforms.digital_tow_path.site.FileMetaProber"),
+    ):
+        utils_mock.parse_listing_date = utils.parse_listing_date
+        utils_mock.year_in_range = utils.year_in_range
+        utils_mock.get_categories.return_value = [
+            {"name": "Town Board", "url": f"{base}/2026"}
+        ]
+        utils_mock.get_meetings_for_category_year.side_effect = lambda url, **kwargs: (
+            meetings[url],
+            None,
+        )
+        utils_mock.get_other_years_from_soup.return_value = years
+        utils_mock.get_meeting_details.return_value = {"meeting_date": None}
+        site.scrape("2025-12-01", "2026-01-31")
+    fetched_years = [
+        c.args[0] for c in utils_mock.get_meetings_for_category_year.call_args_list
+    ]
+    assert fetched_years == [f"{base}/2026", f"{base}/2025"]
+    fetched_details = [c.args[0] for c in utils_mock.get_meeting_details.call_args_list]
+    assert fetched_details == ["d/29", "d/28"]
+
+
+def test_scrape_fetches_details_concurrently_in_order():
+    "Detail pages should be fetched in parallel and assets kept in listing order"
+    base = "https://finetownny.gov/meetings/meetings/Town%20Board/2026"
+    meetings = [
+        {"title": f"January {day}, 2026: Regular", "url": f"d/{day}", "detail_id": day}
+        for day in ("20", "13", "6")
+    ]
+    # Both of the first two fetches must be in flight at once to get past this
+    barrier = threading.Barrier(2, timeout=5)
+
+    def details(url, **kwargs):
+        day = int(url.split("/")[-1])
+        if day != 6:
+            barrier.wait()
+        return {
+            "meeting_date": datetime.date(2026, 1, day),
+            "documents": [{"type": "agenda", "url": f"https://a.gov/{day}.pdf"}],
+        }
+
+    site = DigitalTowPathSite("https://finetownny.gov/categories/")
+    to_patch = "civic_scraper.platforms.digital_tow_path.site.utils"
+    with (
+        patch(to_patch) as utils_mock,
+        patch("civic_scraper.platforms.digital_tow_path.site.FileMetaProber"),
+    ):
+        utils_mock.parse_listing_date = utils.parse_listing_date
+        utils_mock.parse_meeting_datetime = utils.parse_meeting_datetime
+        utils_mock.get_categories.return_value = [{"name": "Board", "url": base}]
+        utils_mock.get_meetings_for_category_year.return_value = (meetings, None)
+        utils_mock.get_other_years_from_soup.return_value = []
+        utils_mock.get_meeting_details.side_effect = details
+        assets = site.scrape("2026-01-01", "2026-01-31", max_workers=3)
+    assert [asset.url for asset in assets] == [
+        "https://a.gov/20.pdf",
+        "https://a.gov/13.pdf",
+        "https://a.gov/6.pdf",
+    ]
@@ -5,6 +5,7 @@ Run with: pipenv run pytest -sv tests/test_digital_tow_path_utils.py
 """
 
 import datetime
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bs4 import BeautifulSoup
@@ -64,6 +65,37 @@ class TestParseMeetingDatetime:
         assert result == datetime.datetime(2026, 2, 11, 0, 0)
 
 
+class TestParseListingDate:
+    def test_basic(self):
+        title = "February 11, 2026: February Regular Town Board Meeting"
+        assert utils.parse_listing_date(title) == datetime.date(2026, 2, 11)
+
+    def test_no_date(self):
+        assert utils.parse_listing_date("Special Meeting") is None
+
+    def test_invalid_month(self):
+        assert utils.parse_listing_date("Smarch 11, 2026: Meeting") is None
+
+    def test_empty(self):
+        assert utils.parse_listing_date(None) is None
+
+
+class TestYearInRange:
+    def test_inside(self):
+        start, end = datetime.date(2024, 12, 1), datetime.date(2025, 1, 31)
+        assert utils.year_in_range("2024", start, end)
+        assert utils.year_in_range("2025", start, end)
+
+    def test_outside(self):
+        start, end = datetime.date(2025, 1, 1), datetime.date(2025, 1, 31)
+        assert not utils.year_in_range("2024", start, end)
+        assert not utils.year_in_range("2026", start, end)
+
+    def test_unknown_year_is_kept(self):
+        start, end = datetime.date(2025, 1, 1), datetime.date(2025, 1, 31)
+        assert utils.year_in_range("Archive", start, end)
+
+
 class TestExtractDocuments:
     def test_agenda_only(self):
         html = """
@@ -163,6 +195,16 @@ class TestExtractDocuments:
         assert docs[1]["url"] == "https://example.com/minutes.pdf"
 
 
+def test_fetch_page_throttles_host():
+    "fetch_page should register the polite host rate without a Site instance"
+    url = "https://finetownny.gov/meetings/meetings/"
+    session = MagicMock()
+    session.get.return_value.text = "<html></html>"
+    with patch.object(utils, "rate_limiter") as limiter:
+        utils.fetch_page(url, session=session)
+    limiter.set_rate.assert_called_once_with(url, 1 / utils.REQUEST_DELAY)
+
+
 # --- VCR-based tests (use recorded HTTP cassettes) ---
 
 
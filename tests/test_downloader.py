@@ -0,0 +1,142 @@
+import threading
+from unittest.mock import MagicMock
+
+from civic_scraper.base.downloader import Downloader
+from civic_scraper.base.http import interleave_by_host
+
+
+def _mock_asset(url, side_effect=None):
+    asset = MagicMock(url=url)
+    asset.download.side_effect = side_effect
+    asset.download.return_value = f"/tmp/{url.rsplit('/', 1)[-1]}.pdf"
+    return asset
+
+
+def test_download_continues_past_failures(tmpdir):
+    "A failed download should be reported without stopping the others"
+    good = _mock_asset("https://a.gov/1")
+    bad = _mock_asset("https://a.gov/2", side_effect=IOError("boom"))
+    other = _mock_asset("https://b.gov/3")
+    downloader = Downloader(str(tmpdir), max_workers=3)
+    downloaded, failed = downloader.download([good, bad, other])
+    assert downloaded == 2
+    assert [(asset.url, str(error)) for asset, error in failed] == [
+        ("https://a.gov/2", "boom")
+    ]
+
+
+def test_download_reuses_session_per_host(tmpdir):
+    "Assets on the same host should share one pooled session"
+    assets = [_mock_asset(f"https://a.gov/{i}") for i in range(3)]
+    assets.append(_mock_asset("https://b.gov/1"))
+    downloader = Downloader(str(tmpdir), max_workers=2)
+    downloader.download(assets)
+    sessions = [asset.download.call_args.kwargs["session"] for asset in assets]
+    assert sessions[0] is sessions[1] is sessions[2]
+    assert sessions[3] is not sessions[0]
+
+
+def test_download_respects_per_host_cap(tmpdir):
+    "No more than max_per_host downloads should hit one host at a time"
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fake_download(*args, **kwargs):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        with lock:
+            in_flight.pop()
+
+    assets = [_mock_asset(f"https://a.gov/{i}") for i in range(8)]
+    for asset in assets:
+        asset.download.side_effect = fake_download
+    downloader = Downloader(str(tmpdir), max_workers=8, max_per_host=2)
+    downloaded, failed = downloader.download(assets)
+    assert downloaded == 8
+    assert not failed
+    assert max(peak) <= 2
+
+
+def test_submit_downloads_batches_concurrently(tmpdir):
+    "Batches submitted one host at a time should share the worker pool"
+    # Every host's download must be in flight at once to get past this
+    barrier = threading.Barrier(4, timeout=5)
+    downloader = Downloader(str(tmpdir), max_workers=8, max_per_host=1)
+    batches = []
+    for host in "abcd":
+        batch = [_mock_asset(f"https://{host}.gov/{i}") for i in range(3)]
+        batch[0].download.side_effect = lambda *args, **kwargs: barrier.wait()
+        batches.append(batch)
+        downloader.submit(batch)
+    downloaded, failed = downloader.wait()
+    downloader.close()
+    assert downloaded == 12
+    assert not failed
+
+
+def test_submit_respects_per_host_cap_across_batches(tmpdir):
+    "The per-host cap should hold for assets queued in separate batches"
+    in_flight = {}
+    peak = {}
+    lock = threading.Lock()
+
+    def fake_download(asset):
+        def download(*args, **kwargs):
+            host = asset.url.split("/")[2]
+            with lock:
+                in_flight[host] = in_flight.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), in_flight[host])
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight[host] -= 1
+
+        return download
+
+    downloader = Downloader(str(tmpdir), max_workers=8, max_per_host=2)
+    for batch in range(3):
+        assets = [
+            _mock_asset(f"https://{h}.gov/{batch}-{i}") for h in "ab" for i in range(3)
+        ]
+        for asset in assets:
+            asset.download.side_effect = fake_download(asset)
+        downloader.submit(assets)
+    downloaded, failed = downloader.wait()
+    downloader.close()
+    assert downloaded == 18
+    assert max(peak.values()) <= 2
+
+
+def test_wait_reports_each_round_once(tmpdir):
+    "wait should report failures in queue order and reset its counts"
+    downloader = Downloader(str(tmpdir), max_workers=4)
+    downloader.submit(
+        [
+            _mock_asset("https://a.gov/1", side_effect=IOError("first")),
+            _mock_asset("https://b.gov/2"),
+            _mock_asset("https://c.gov/3", side_effect=IOError("second")),
+        ]
+    )
+    downloaded, failed = downloader.wait()
+    assert downloaded == 1
+    assert [str(error) for _, error in failed] == ["first", "second"]
+    downloader.submit([_mock_asset("https://a.gov/4")])
+    assert downloader.wait() == (1, [])
+    downloader.close()
+
+
+def test_interleave_by_host():
+    assets = [
+        MagicMock(url="https://a.gov/1"),
+        MagicMock(url="https://a.gov/2"),
+        MagicMock(url="https://a.gov/3"),
+        MagicMock(url="https://b.gov/1"),
+    ]
+    ordered = [asset.url for asset in interleave_by_host(assets)]
+    assert ordered == [
+        "https://a.gov/1",
+        "https://b.gov/1",
+        "https://a.gov/2",
+        "https://a.gov/3",
+    ]
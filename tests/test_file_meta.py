@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from civic_scraper.base.asset import Asset, AssetCollection
+from civic_scraper.base.file_meta import FileMetaProber
+
+
+def _session(headers_by_url):
+    session = MagicMock(name="Session")
+
+    def head(url, **kwargs):
+        headers = headers_by_url[url]
+        if isinstance(headers, Exception):
+            raise headers
+        return MagicMock(headers=headers)
+
+    session.head.side_effect = head
+    return session
+
+
+def test_probe_fills_assets_in_place():
+    session = _session(
+        {
+            "https://a.gov/1": {"content-type": "application/pdf"},
+            "https://b.gov/2": {"content-type": "text/html", "content-length": "42"},
+        }
+    )
+    assets = AssetCollection([Asset("https://a.gov/1"), Asset("https://b.gov/2")])
+    FileMetaProber(max_workers=2, session=session, missing_length="-1").probe(assets)
+    assert [(a.content_type, a.content_length) for a in assets] == [
+        ("application/pdf", "-1"),
+        ("text/html", "42"),
+    ]
+
+
+def test_probe_caches_by_url():
+    "Duplicate URLs should only be requested once"
+    session = _session({"https://a.gov/1": {"content-type": "application/pdf"}})
+    prober = FileMetaProber(max_workers=4, session=session)
+    prober.probe([Asset("https://a.gov/1"), Asset("https://a.gov/1")])
+    prober.probe([Asset("https://a.gov/1")])
+    assert session.head.call_count == 1
+
+
+def test_probe_failure_leaves_asset_unchanged():
+    session = _session({"https://a.gov/1": ConnectionError("refused")})
+    asset = Asset("https://a.gov/1")
+    FileMetaProber(session=session).probe([asset])
+    assert asset.content_type is None
+    assert asset.content_length is None
@@ -0,0 +1,180 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from civic_scraper.base.cache import Cache
+from civic_scraper.base.manifest import Manifest
+from civic_scraper.platforms import GranicusSite
+from civic_scraper.runner import Runner
+
+RSS_URL = "https://brookhavencityga.iqm2.com/Services/RSS.aspx?Feed=Calendar"
+
+
+def _item(meeting_id, title, published):
+    return f"""
+    <item>
+      <title>{title}</title>
+      <link>https://brookhavencityga.iqm2.com/Citizens/Detail_Meeting.aspx?ID={meeting_id}</link>
+      <pubDate>{published}</pubDate>
+    </item>"""
+
+
+def _feed(*items):
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0"><channel><title>Calendar</title>{"".join(items)}
+</channel></rss>"""
+
+
+ITEMS = [
+    _item(
+        3,
+        "City Council - Agenda - Jan 27, 2026 07:00 PM",
+        "Tue, 20 Jan 2026 15:00:00 GMT",
+    ),
+    _item(
+        2,
+        "Planning Commission - Agenda - Jan 14, 2026 06:30 PM",
+        "Wed, 07 Jan 2026 15:00:00 GMT",
+    ),
+    _item(
+        1,
+        "City Council - Minutes - Jan 06, 2026 07:00 PM",
+        "Mon, 05 Jan 2026 15:00:00 GMT",
+    ),
+]
+
+
+def _response(status_code=200, text="", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.headers = {}
+    to_patch = "civic_scraper.platforms.granicus.site.create_session"
+    with patch(to_patch, return_value=session):
+        yield session
+
+
+@pytest.fixture
+def site(tmp_path):
+    return GranicusSite(RSS_URL, cache=Cache(str(tmp_path)))
+
+
+def _sent_headers(session):
+    return session.get.call_args.kwargs["headers"]
+
+
+def test_scrape_saves_validators(session, site):
+    session.get.return_value = _response(
+        text=_feed(*ITEMS),
+        headers={"etag": '"abc"', "last-modified": "Tue, 20 Jan 2026 15:00:00 GMT"},
+    )
+    assets = site.scrape(download=False)
+    assert [asset.meeting_id for asset in assets] == [
+        "granicus_brookhavencityga_3",
+        "granicus_brookhavencityga_2",
+        "granicus_brookhavencityga_1",
+    ]
+    assert _sent_headers(session) == {}
+
+    session.get.return_value = _response(status_code=304)
+    cached = site.scrape(download=False)
+    assert _sent_headers(session) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 20 Jan 2026 15:00:00 GMT",
+    }
+    # A 304 reuses the cached copy of the feed
+    assert [asset.asset_name for asset in cached] == [
+        asset.asset_name for asset in assets
+    ]
+
+
+def test_scrape_incremental(session, site):
+    session.get.return_value = _response(text=_feed(*ITEMS[1:]), headers={"etag": "1"})
+    assert len(site.scrape(download=False, incremental=True)) == 2
+
+    session.get.return_value = _response(status_code=304)
+    assert len(site.scrape(download=False, incremental=True)) == 0
+
+    session.get.return_value = _response(text=_feed(*ITEMS), headers={"etag": "2"})
+    assets = site.scrape(download=False, incremental=True)
+    assert [asset.meeting_id for asset in assets] == ["granicus_brookhavencityga_3"]
+    assert _sent_headers(session) == {"If-None-Match": "1"}
+
+
+def test_scrape_refetches_when_cached_feed_is_missing(session, site, tmp_path):
+    session.get.return_value = _response(text=_feed(*ITEMS), headers={"etag": "1"})
+    site.scrape(download=False)
+    for path in tmp_path.joinpath("artifacts", "granicus").iterdir():
+        path.unlink()
+
+    session.get.side_effect = [
+        _response(status_code=304),
+        _response(text=_feed(*ITEMS), headers={"etag": "1"}),
+    ]
+    assert len(site.scrape(download=False)) == 3
+    assert _sent_headers(session) == {}
+
+
+def test_scrape_failure_does_not_advance_manifest(session, site):
+    "A feed that fails to parse into assets should be fetched in full next run"
+    bad_item = _item(4, "Malformed title", "Wed, 21 Jan 2026 15:00:00 GMT")
+    session.get.return_value = _response(
+        text=_feed(bad_item, *ITEMS), headers={"etag": "1"}
+    )
+    with pytest.raises(ValueError):
+        site.scrape(download=False, incremental=True)
+    assert Manifest(site.cache.feed_manifest_path).get(RSS_URL) is None
+
+    session.get.return_value = _response(text=_feed(*ITEMS), headers={"etag": "2"})
+    assert len(site.scrape(download=False, incremental=True)) == 3
+    assert _sent_headers(session) == {}
+
+
+def test_scrape_by_publish_date(session, site):
+    "Entries published outside the range are skipped before being parsed"
+    session.get.return_value = _response(text=_feed(*ITEMS))
+    with patch.object(
+        GranicusSite, "create_asset", wraps=site.create_asset
+    ) as create_asset:
+        assets = site.scrape("2026-01-06", "2026-01-19", cache=True, timeout=5)
+    assert [asset.meeting_id for asset in assets] == ["granicus_brookhavencityga_2"]
+    assert create_asset.call_count == 1
+    assert session.get.call_args.kwargs["timeout"] == 5
+
+
+def test_scrape_keeps_entries_without_publish_date(session, site):
+    item = _item(4, "City Council - Agenda - Feb 03, 2026 07:00 PM", "")
+    session.get.return_value = _response(text=_feed(item, *ITEMS))
+    assets = site.scrape("2026-01-20", "2026-01-31")
+    assert [asset.meeting_id for asset in assets] == [
+        "granicus_brookhavencityga_4",
+        "granicus_brookhavencityga_3",
+    ]
+
+
+def test_runner_scrapes_feeds_concurrently(session, tmp_path):
+    "Concurrent feed scrapes should keep every feed's validators"
+    urls = [RSS_URL.replace("brookhaven", city) for city in ("a", "b", "c", "d")]
+    session.get.side_effect = lambda url, **kwargs: _response(
+        text=_feed(*ITEMS), headers={"etag": url}
+    )
+    cache_path = str(tmp_path / "run")
+    runner = Runner(cache_path)
+    assets = runner.scrape(
+        "2026-01-01",
+        "2026-01-31",
+        site_urls=urls,
+        platform="granicus",
+        max_workers=4,
+    )
+    assert len(assets) == 12
+    # Feed state lands under the Runner's cache even without cache=True
+    manifest = Manifest(Cache(cache_path).feed_manifest_path)
+    assert [manifest.get(url)["etag"] for url in urls] == urls
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from civic_scraper.base.http import HostRateLimiter, create_session
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    "Freeze time.monotonic at a value tests can advance"
+    now = [100.0]
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    return now
+
+
+def test_rate_limiter_waits_per_host(clock):
+    "Each host should be limited independently of the others"
+    limiter = HostRateLimiter(rate=1, burst=2)
+    delays = [limiter.wait("https://a.gov/page") for _ in range(4)]
+    assert delays == [0, 0, 1, 2]
+    assert limiter.wait("https://b.gov/page") == 0
+
+
+def test_rate_limiter_refills_over_time(clock):
+    limiter = HostRateLimiter(rate=2)
+    assert limiter.wait("https://a.gov/1") == 0
+    clock[0] += 0.5
+    assert limiter.wait("https://a.gov/2") == 0
+    assert limiter.wait("https://a.gov/3") == 0.5
+
+
+def test_rate_limiter_host_override(clock):
+    "A per-host rate should apply even when the default is unlimited"
+    limiter = HostRateLimiter()
+    limiter.set_rate("https://slow.gov/meetings", 0.5)
+    assert [limiter.wait("https://slow.gov/x") for _ in range(2)] == [0, 2]
+    assert [limiter.wait("https://fast.gov/x") for _ in range(2)] == [0, 0]
+
+
+def test_session_requests_wait_on_limiter():
+    limiter = HostRateLimiter(rate=1)
+    session = create_session(limiter=limiter)
+    request = requests.Request("GET", "https://a.gov/page").prepare()
+    adapter = session.get_adapter(request.url)
+    with (
+        patch.object(limiter, "wait") as wait,
+        patch("requests.adapters.HTTPAdapter.send") as send,
+    ):
+        adapter.send(request)
+    wait.assert_called_once_with("https://a.gov/page")
+    send.assert_called_once()
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+from civic_scraper import platforms
+from civic_scraper.runner import PLATFORMS
+
+HEAVY_MODULES = ["legistar", "demjson3", "feedparser", "lxml.html", "bs4"]
+
+
+def _imported_after(code):
+    "Run code in a fresh interpreter and list which heavy modules it imported"
+    script = (
+        "import sys\n"
+        f"{code}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def test_cli_import_skips_platform_dependencies():
+    "Importing the CLI should not import any platform's dependencies"
+    assert _imported_after("import civic_scraper.cli") == []
+
+
+def test_site_class_imports_only_its_platform():
+    "Resolving one platform should not import the others' dependencies"
+    code = (
+        "from civic_scraper.runner import Runner\n"
+        "Runner()._get_site_class('https://nc-nashcounty.civicplus.com/AgendaCenter')"
+    )
+    assert _imported_after(code) == ["bs4"]
+
+
+@pytest.mark.parametrize("class_name", sorted(set(PLATFORMS.values())))
+def test_registry_classes_resolve(class_name):
+    site_class = getattr(platforms, class_name)
+    assert site_class.__name__ in (class_name, "Site")
+
+
+def test_unknown_platform_attribute():
+    with pytest.raises(AttributeError):
+        platforms.NotASite
+
+
+def test_package_import_does_not_run_git():
+    "Importing civic_scraper should not compute the version or git commit"
+    code = (
+        "import subprocess\n"
+        "def fail(*args, **kwargs): raise AssertionError('git subprocess spawned')\n"
+        "subprocess.check_output = fail\n"
+        "import civic_scraper, civic_scraper.cli\n"
+        "assert '__git_commit__' not in vars(civic_scraper)"
+    )
+    assert _imported_after(code) == []
+
+
+def test_lazy_version_attributes():
+    import civic_scraper
+    from civic_scraper.utils import scraped_by
+
+    assert isinstance(civic_scraper.__version__, str)
+    assert isinstance(civic_scraper.__git_commit__, str)
+    assert scraped_by() == f"civic-scraper_{civic_scraper.__version__}"
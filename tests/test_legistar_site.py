@@ -1,11 +1,18 @@
 import datetime
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 import pytz
+from legistar.events import LegistarEventsScraper
+from lxml import html
 
 from civic_scraper.base.cache import Cache
 from civic_scraper.platforms import LegistarSite
+from civic_scraper.platforms.legistar import site as legistar_site
+
+from .conftest import benchmark, best_of, read_fixture
 
 # The VCR cassettes were recorded in 2025. The legistar scraper iterates
 # from current_year+1 down to start_year, so as years pass it makes more
@@ -188,7 +195,7 @@ def test_multiyear_scrape(tmpdir):
 
 
 @pytest.mark.vcr()
-@patch("civic_scraper.platforms.legistar.site.requests.head")
+@patch("requests.Session.head")
 def test_scrape_fetch_file_meta(mock_head):
     "fetch_file_meta=True should populate content_type and content_length without downloading files"
     mock_response = MagicMock()
@@ -210,3 +217,256 @@ def test_scrape_fetch_file_meta(mock_head):
     for asset in assets:
         assert asset.content_type == "application/pdf"
         assert asset.content_length == "453581"
+
+
+def _calendar_event(event_id, date):
+    base = "https://nashville.legistar.com"
+    return {
+        "Name": {"label": "Metropolitan Council"},
+        "Meeting Date": date,
+        "Meeting Time": "6:30 PM",
+        "Meeting Details": {
+            "url": f"{base}/MeetingDetail.aspx?ID={event_id}&GUID=X",
+        },
+        "iCalendar": {"url": f"{base}/View.ashx?M=IC&ID={event_id}"},
+        "Agenda": {"url": f"{base}/View.ashx?M=A&ID={event_id}"},
+        "Minutes": "Not\xa0available",
+    }
+
+
+def test_scrape_requests_only_overlapping_years():
+    "Only years in the date range should be requested, stopping before start_date"
+    pages = {
+        2022: [
+            [_calendar_event(5, "1/20/2022"), _calendar_event(4, "1/4/2022")],
+            [_calendar_event(3, "1/2/2022")],
+        ],
+        2021: [
+            [_calendar_event(2, "12/21/2021"), _calendar_event(1, "12/7/2021")],
+            [_calendar_event(0, "11/30/2021")],
+        ],
+    }
+    requested = []
+
+    def event_pages(year):
+        for page in pages[year]:
+            requested.append((year, page[0]["Meeting Date"]))
+            yield page
+
+    site = LegistarSite(
+        "https://nashville.legistar.com/Calendar.aspx", timezone="US/Central"
+    )
+    to_patch = "civic_scraper.platforms.legistar.site.EVENTS_TABLE"
+    with (
+        patch.object(LegistarEventsScraper, "eventPages", side_effect=event_pages),
+        patch.object(LegistarEventsScraper, "parseDataTable") as parse,
+        patch(to_patch, side_effect=lambda page: [page]),
+    ):
+        parse.side_effect = lambda page: [(event, None, None) for event in page]
+        assets = site.scrape("2021-12-21", "2022-01-04")
+    assert [asset.meeting_id for asset in assets] == [
+        "legistar_nashville_4",
+        "legistar_nashville_3",
+        "legistar_nashville_2",
+    ]
+    # The 2021 listing stops at the first event before start_date
+    assert requested == [(2022, "1/20/2022"), (2022, "1/2/2022"), (2021, "12/21/2021")]
+
+
+def _api_session(records):
+    "Mock session serving Web API event records with $top/$skip paging"
+
+    def get(url, params=None, timeout=None):
+        skip, top = params["$skip"], params["$top"]
+        response = MagicMock()
+        response.json.return_value = records[skip:][:top]
+        return response
+
+    session = MagicMock()
+    session.get.side_effect = get
+    return session
+
+
+def _api_records():
+    return json.loads(read_fixture("legistar_api_events.json"))
+
+
+def _html_calendar_page(page_html=None):
+    "Parse a calendar page the way the legistar scraper does"
+    page = html.fromstring(page_html or read_fixture("legistar_calendar_page.html"))
+    page.make_links_absolute("https://nashville.legistar.com/Calendar.aspx")
+    return page
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        LegistarSite("https://nashville.legistar.com/Calendar.aspx", backend="xml")
+
+
+def test_scrape_api_backend():
+    "The Web API backend filters by date server side and pages with $top/$skip"
+    session = _api_session(_api_records())
+    site = LegistarSite(
+        "https://nashville.legistar.com/Calendar.aspx",
+        timezone="US/Central",
+        backend="api",
+    )
+    with (
+        patch.object(legistar_site, "create_session", return_value=session),
+        patch.object(legistar_site, "API_PAGE_SIZE", 40),
+    ):
+        assets = site.scrape("2022-06-01", "2022-06-28")
+    (url,) = {call.args[0] for call in session.get.call_args_list}
+    assert url == "https://webapi.legistar.com/v1/nashville/events"
+    params = session.get.call_args.kwargs["params"]
+    assert params["$filter"] == (
+        "EventDate ge datetime'2022-06-01' and EventDate le datetime'2022-06-28'"
+    )
+    # 150 records in pages of 40
+    assert [call.kwargs["params"]["$skip"] for call in session.get.call_args_list] == [
+        0,
+        40,
+        80,
+        120,
+    ]
+    # The mock ignores $filter, so out of range events are dropped client side
+    assert {asset.meeting_date.month for asset in assets} == {6}
+    agenda = assets[0]
+    assert agenda.committee_name == "Metropolitan Council"
+    assert agenda.meeting_id == "legistar_nashville_957600"
+    assert agenda.asset_name == "Metropolitan Council - 957600 - Agenda"
+    assert agenda.asset_type == "agenda"
+    assert agenda.meeting_date == datetime.datetime(2022, 6, 28)
+    assert agenda.meeting_time == pytz.timezone("US/Central").localize(
+        datetime.datetime(2022, 6, 28, 16, 0)
+    )
+    assert agenda.url.endswith(
+        "957600_A_Metropolitan_Council_22-06-28_Meeting_Agenda.pdf"
+    )
+    minutes = assets[1]
+    assert minutes.asset_type == "minutes"
+    assert minutes.meeting_id == agenda.meeting_id
+
+
+def test_file_meta_shares_pooled_session():
+    "HEAD probes should reuse the scrape session, concurrently when asked"
+    session = _api_session(_api_records())
+    # Two probes must be in flight at once to get past this
+    barrier = threading.Barrier(2, timeout=5)
+
+    def head(url, **kwargs):
+        barrier.wait()
+        response = MagicMock()
+        response.headers = {"content-type": "application/pdf"}
+        return response
+
+    session.head.side_effect = head
+    site = LegistarSite(
+        "https://nashville.legistar.com/Calendar.aspx",
+        timezone="US/Central",
+        backend="api",
+        pool_size=4,
+    )
+    with patch.object(
+        legistar_site, "create_session", return_value=session
+    ) as create_session:
+        assets = site.scrape(
+            "2022-06-27", "2022-06-28", fetch_file_meta=True, max_workers=2
+        )
+    create_session.assert_called_once_with(pool_size=4)
+    assert session.head.call_count == len(assets) == 4
+    for asset in assets:
+        assert asset.content_type == "application/pdf"
+        assert asset.content_length == "-1"
+
+
+def test_file_meta_skips_throttled_calendar_session():
+    "HTML backend probes should use a plain pooled session, not the scraper"
+    file_session = MagicMock()
+    file_session.head.return_value.headers = {"content-type": "application/pdf"}
+    site = LegistarSite(
+        "https://nashville.legistar.com/Calendar.aspx", timezone="US/Central"
+    )
+    with (
+        patch.object(
+            LegistarEventsScraper, "eventPages", return_value=[_html_calendar_page()]
+        ),
+        patch.object(LegistarEventsScraper, "head") as scraper_head,
+        patch.object(
+            legistar_site, "create_session", return_value=file_session
+        ) as create_session,
+    ):
+        assets = site.scrape("2022-06-27", "2022-06-28", fetch_file_meta=True)
+    create_session.assert_called_once_with(pool_size=10)
+    scraper_head.assert_not_called()
+    assert file_session.head.call_count == len(assets) == 4
+    # The scraper's headers (e.g. User-Agent) carry over to file requests
+    headers = file_session.headers.update.call_args.args[0]
+    assert "User-Agent" in headers
+
+
+def test_webscraper_pool_size():
+    site = LegistarSite(
+        "https://nashville.legistar.com/Calendar.aspx",
+        timezone="US/Central",
+        pool_size=3,
+    )
+    adapter = site._webscraper().get_adapter("https://nashville.legistar.com")
+    assert adapter._pool_maxsize == 3
+
+
+def test_api_backend_matches_html_backend():
+    "Both backends should build the same assets for the same calendar"
+    url = "https://nashville.legistar.com/Calendar.aspx"
+    api_site = LegistarSite(url, timezone="US/Central", backend="api")
+    with patch.object(
+        legistar_site, "create_session", return_value=_api_session(_api_records())
+    ):
+        api_assets = api_site.scrape("2022-04-01", "2022-06-30")
+    html_site = LegistarSite(url, timezone="US/Central")
+    with patch.object(
+        LegistarEventsScraper, "eventPages", return_value=[_html_calendar_page()]
+    ):
+        html_assets = html_site.scrape("2022-04-01", "2022-06-30")
+    fields = [
+        "committee_name",
+        "meeting_date",
+        "meeting_time",
+        "meeting_id",
+        "asset_name",
+        "asset_type",
+    ]
+
+    def rows(assets):
+        return [tuple(getattr(asset, field) for field in fields) for asset in assets]
+
+    assert len(api_assets) > 100
+    assert rows(api_assets) == rows(html_assets)
+
+
+@benchmark
+def test_api_backend_benchmark():
+    "Decoding Web API JSON should cost less per event than parsing calendar HTML"
+    site = LegistarSite(
+        "https://nashville.legistar.com/Calendar.aspx", timezone="US/Central"
+    )
+    webscraper = site._webscraper()
+    page_html = read_fixture("legistar_calendar_page.html")
+    api_json = read_fixture("legistar_api_events.json")
+
+    def parse_html():
+        page = _html_calendar_page(page_html)
+        with patch.object(webscraper, "eventPages", return_value=[page]):
+            return list(site._events(webscraper, "2022-01-01", "2022-12-31"))
+
+    def parse_api():
+        session = MagicMock()
+        session.get.return_value.json.side_effect = lambda: json.loads(api_json)
+        return list(site._api_events(session, "2022-01-01", "2022-12-31"))
+
+    def per_event(func):
+        return best_of(func) / len(func())
+
+    before = per_event(parse_html)
+    after = per_event(parse_api)
+    assert after < before
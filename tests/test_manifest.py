@@ -0,0 +1,59 @@
+import threading
+
+from civic_scraper.base.manifest import Manifest
+
+
+def test_manifest_round_trip(tmpdir):
+    path = tmpdir.join("manifests", "downloads.json")
+    manifest = Manifest(path)
+    assert manifest.get("https://a.gov/1") is None
+    manifest.update("https://a.gov/1", {"etag": '"v1"'})
+    manifest.save()
+    assert Manifest(path).get("https://a.gov/1") == {"etag": '"v1"'}
+
+
+def test_manifest_remove(tmpdir):
+    manifest = Manifest(tmpdir.join("downloads.json"))
+    manifest.update("https://a.gov/1", {"etag": '"v1"'})
+    manifest.remove("https://a.gov/1")
+    assert len(manifest) == 0
+
+
+def test_manifest_instances_merge_on_save(tmpdir):
+    "Instances sharing a file should keep each other's records"
+    path = tmpdir.join("feeds.json")
+    first, second = Manifest(path), Manifest(path)
+    first.update("https://a.gov/1", {"etag": "1"})
+    second.update("https://b.gov/1", {"etag": "2"})
+    first.save()
+    second.save()
+    assert Manifest(path).get("https://a.gov/1") == {"etag": "1"}
+    assert Manifest(path).get("https://b.gov/1") == {"etag": "2"}
+    second.remove("https://b.gov/1")
+    second.save()
+    assert len(Manifest(path)) == 1
+
+
+def test_manifest_concurrent_saves(tmpdir):
+    "Concurrent saves from separate instances should not lose records"
+    path = tmpdir.join("manifests", "feeds.json")
+    barrier = threading.Barrier(8, timeout=5)
+    errors = []
+
+    def save(i):
+        manifest = Manifest(path)
+        manifest.update(f"https://{i}.gov/rss", {"etag": str(i)})
+        barrier.wait()
+        try:
+            manifest.save()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(Manifest(path)) == 8
+    assert [f.basename for f in tmpdir.join("manifests").listdir()] == ["feeds.json"]
@@ -1,8 +1,12 @@
+import json
+import threading
+from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 
+from civic_scraper.base.asset import Asset
 from civic_scraper.runner import Runner, ScraperError
 
 
@@ -15,9 +19,11 @@ def test_runner_site_scrape(civic_scraper_dir, one_site_url):
         start_date = end_date = "2020-12-01"
         r = Runner(civic_scraper_dir)
         r.scrape(start_date, end_date, one_site_url)
+        # Sites get the run's cache even when caching artifacts is off
         site_class.assert_called_once_with(
-            "http://nc-nashcounty.civicplus.com/AgendaCenter"
+            "http://nc-nashcounty.civicplus.com/AgendaCenter", cache=ANY
         )
+        assert site_class.call_args.kwargs["cache"].path == civic_scraper_dir
         site_instance = site_class.return_value
         site_instance.scrape.assert_called_once_with(
             "2020-12-01",
@@ -57,11 +63,11 @@ def test_runner_site_cache(cache_mock, get_site_mock, civic_scraper_dir, one_sit
     )
 
 
-@patch("civic_scraper.runner.AssetCollection")
+@patch("civic_scraper.runner.Downloader")
 @patch("civic_scraper.runner.Runner._get_site_class")
 @pytest.mark.usefixtures("set_default_env")
 def test_runner_no_download_via_site(
-    get_site_mock, asset_collection, civic_scraper_dir, one_site_url
+    get_site_mock, downloader, civic_scraper_dir, one_site_url
 ):
     "Runner should not trigger download via Site.scrape"
     # The runner is primarily intended for use by the CLI layer,
@@ -72,7 +78,8 @@ def test_runner_no_download_via_site(
     get_site_mock.return_value = site_class
     # Also need to configure return value for the scrape method
     site_instance = site_class.return_value
-    site_instance.scrape.return_value = [Mock(name="AssetCollection")]
+    site_instance.scrape.return_value = [Asset("https://a.gov/1")]
+    downloader.return_value.wait.return_value = ([], [])
     start_date = end_date = "2012-12-01"
     r = Runner(civic_scraper_dir)
     r.scrape(start_date, end_date, site_urls=one_site_url, cache=True, download=True)
@@ -84,50 +91,46 @@ def test_runner_no_download_via_site(
         cache=True,
         timeout=None,
     )
-    # AssetCollection is instantiated and to_csv called by default
-    asset_collection.assert_called_once()
-    ac_instance = asset_collection.return_value
-    ac_instance.to_csv.assert_called_once()
+    # Metadata file is written by default
+    metadata_dir = Path(civic_scraper_dir, "metadata")
+    assert len(list(metadata_dir.glob("*.csv"))) == 1
 
 
 @patch("civic_scraper.platforms.civic_plus.site.Asset")
-@patch("civic_scraper.runner.AssetCollection")
 @pytest.mark.vcr()
 @pytest.mark.usefixtures("set_default_env")
-def test_runner_downloads_assets(asset_collection, asset_mock, civic_scraper_dir):
+def test_runner_downloads_assets(asset_mock, civic_scraper_dir):
     "Runner should trigger download on assets if requested"
     url = "http://nc-nashcounty.civicplus.com/AgendaCenter"
     start_date = end_date = "2020-05-05"
-    # The VCR cassette produces 2 assets. Configure the mock
-    # AssetCollection to yield mock assets so the runner's
-    # download loop can iterate over them.
-    ac_instance = asset_collection.return_value
-    mock_assets = [MagicMock(), MagicMock()]
-    ac_instance.__iter__ = Mock(return_value=iter(mock_assets))
+    # The VCR cassette produces 2 assets. Have the site build
+    # mock assets so the download calls can be checked.
+    mock_assets = [MagicMock(url=f"{url}/ViewFile/{i}") for i in range(2)]
+    asset_mock.side_effect = mock_assets
     r = Runner(civic_scraper_dir)
-    r.scrape(start_date, end_date, site_urls=[url], download=True)
-    # Check AssetCollection is instantiated and to_csv called by default
-    asset_collection.assert_called_once()
-    ac_instance.to_csv.assert_called_once()
+    assets = r.scrape(start_date, end_date, site_urls=[url], download=True)
+    assert list(assets) == mock_assets
+    # Check metadata file is written by default
+    metadata_dir = Path(civic_scraper_dir, "metadata")
+    assert len(list(metadata_dir.glob("*.csv"))) == 1
     # Check Asset.download is called on each asset
     assets_dir = str(Path(civic_scraper_dir).joinpath("assets"))
     for mock_asset in mock_assets:
-        mock_asset.download.assert_called_once_with(assets_dir, timeout=None)
+        mock_asset.download.assert_called_once_with(
+            assets_dir, session=ANY, timeout=None, manifest=ANY, store=None
+        )
 
 
-@patch("civic_scraper.runner.AssetCollection")
 @pytest.mark.usefixtures("set_default_env")
-def test_runner_passes_timeout(asset_collection, civic_scraper_dir, one_site_url):
+def test_runner_passes_timeout(civic_scraper_dir, one_site_url):
     "Runner should pass timeout to site.scrape and asset.download"
     site_class = MagicMock(name="CivicPlusSite")
     to_patch = "civic_scraper.runner.Runner._get_site_class"
-    mock_asset = MagicMock()
+    mock_asset = MagicMock(url=one_site_url[0])
     with patch(to_patch) as mock_method:
         mock_method.return_value = site_class
         site_instance = site_class.return_value
         site_instance.scrape.return_value = [mock_asset]
-        ac_instance = asset_collection.return_value
-        ac_instance.__iter__ = Mock(return_value=iter([mock_asset]))
         r = Runner(civic_scraper_dir)
         r.scrape("2020-12-01", "2020-12-01", one_site_url, download=True, timeout=30)
         site_instance.scrape.assert_called_once_with(
@@ -137,7 +140,50 @@ def test_runner_passes_timeout(asset_collection, civic_scraper_dir, one_site_url
             timeout=30,
         )
         assets_dir = str(Path(civic_scraper_dir).joinpath("assets"))
-        mock_asset.download.assert_called_once_with(assets_dir, timeout=30)
+        mock_asset.download.assert_called_once_with(
+            assets_dir, session=ANY, timeout=30, manifest=ANY, store=None
+        )
+
+
+@pytest.mark.usefixtures("set_default_env")
+def test_runner_passes_file_meta_options_to_supporting_sites(civic_scraper_dir):
+    "File meta options should only reach sites whose scrape accepts them"
+    from civic_scraper.platforms import CivicPlusSite, DigitalTowPathSite
+
+    urls = [
+        {"url": "http://nc-nashcounty.civicplus.com/AgendaCenter"},
+        {
+            "url": "https://townhope.digitaltowpath.org:10310/content",
+            "platform": "digital-tow-path",
+        },
+    ]
+    with (
+        patch.object(
+            CivicPlusSite, "scrape", autospec=True, return_value=[]
+        ) as civic_plus,
+        patch.object(
+            DigitalTowPathSite, "scrape", autospec=True, return_value=[]
+        ) as digital_tow_path,
+    ):
+        Runner(civic_scraper_dir).scrape(
+            "2020-12-01",
+            "2020-12-01",
+            urls,
+            fetch_file_meta=False,
+            file_meta_workers=4,
+        )
+    civic_plus.assert_called_once_with(
+        ANY,
+        "2020-12-01",
+        "2020-12-01",
+        cache=False,
+        timeout=None,
+        fetch_file_meta=False,
+        file_meta_workers=4,
+    )
+    digital_tow_path.assert_called_once_with(
+        ANY, "2020-12-01", "2020-12-01", cache=False, timeout=None
+    )
 
 
 @pytest.mark.usefixtures("set_default_env")
@@ -205,3 +251,116 @@ def test_runner_per_url_platform_from_dict(civic_scraper_dir):
             "https://finetownny.gov/categories/",
             platform="digital-tow-path",
         )
+
+
+@pytest.mark.usefixtures("set_default_env")
+def test_runner_max_workers_preserves_site_order(civic_scraper_dir, two_site_urls):
+    "Concurrent scrapes should merge assets in the order sites were supplied"
+    first, second = Mock(name="first"), Mock(name="second")
+    first.scrape.return_value = [Asset("https://a1"), Asset("https://a2")]
+    second.scrape.return_value = [Asset("https://b1")]
+    sites = {two_site_urls[0]: first, two_site_urls[1]: second}
+    to_patch = "civic_scraper.runner.Runner._get_site_class"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = lambda url, **kwargs: sites[url]
+        r = Runner(civic_scraper_dir)
+        assets = r.scrape("2020-12-01", "2020-12-01", two_site_urls, max_workers=2)
+    assert [asset.url for asset in assets] == [
+        "https://a1",
+        "https://a2",
+        "https://b1",
+    ]
+
+
+@pytest.mark.usefixtures("set_default_env")
+def test_runner_isolates_site_failures(civic_scraper_dir, two_site_urls):
+    "A failing site should not prevent other sites from being scraped"
+    broken, working = Mock(name="broken"), Mock(name="working")
+    broken.scrape.side_effect = RuntimeError("boom")
+    working.scrape.return_value = [Asset("https://b1")]
+    sites = {two_site_urls[0]: broken, two_site_urls[1]: working}
+    to_patch = "civic_scraper.runner.Runner._get_site_class"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = lambda url, **kwargs: sites[url]
+        r = Runner(civic_scraper_dir)
+        assets = r.scrape("2020-12-01", "2020-12-01", two_site_urls, max_workers=2)
+    assert [asset.url for asset in assets] == ["https://b1"]
+
+
+@pytest.mark.usefixtures("set_default_env")
+def test_runner_streams_metadata_per_site(civic_scraper_dir, two_site_urls):
+    "Metadata for finished sites should be on disk before later sites finish"
+    metadata_dir = Path(civic_scraper_dir, "metadata")
+    first, second = Mock(name="first"), Mock(name="second")
+    first.scrape.return_value = [Asset("https://a1"), Asset("https://a2")]
+    second.scrape.side_effect = lambda *args, **kwargs: (
+        [Asset(line.split(",")[9]) for line in _data_lines(metadata_dir)]
+    )
+    sites = {two_site_urls[0]: first, two_site_urls[1]: second}
+    to_patch = "civic_scraper.runner.Runner._get_site_class"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = lambda url, **kwargs: sites[url]
+        r = Runner(civic_scraper_dir)
+        assets = r.scrape("2020-12-01", "2020-12-01", two_site_urls)
+    # The second site saw the first site's rows already flushed to disk
+    assert [asset.url for asset in assets] == [
+        "https://a1",
+        "https://a2",
+        "https://a1",
+        "https://a2",
+    ]
+
+
+@pytest.mark.usefixtures("set_default_env")
+def test_runner_jsonl_without_keeping_assets(civic_scraper_dir, one_site_url):
+    "Runner can write JSON Lines metadata without holding assets in memory"
+    site = Mock(name="site")
+    site.scrape.return_value = [Asset("https://a1", meeting_date=date(2020, 12, 1))]
+    to_patch = "civic_scraper.runner.Runner._get_site_class"
+    with patch(to_patch) as mock_method:
+        mock_method.return_value = lambda url, **kwargs: site
+        r = Runner(civic_scraper_dir)
+        assets = r.scrape(
+            "2020-12-01",
+            "2020-12-01",
+            one_site_url,
+            output_format="jsonl",
+            keep_assets=False,
+        )
+    assert len(assets) == 0
+    (path,) = Path(civic_scraper_dir, "metadata").glob("*.jsonl")
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(row["url"], row["meeting_date"]) for row in rows] == [
+        ("https://a1", "2020-12-01")
+    ]
+
+
+def _data_lines(metadata_dir):
+    (path,) = metadata_dir.glob("*.csv")
+    return path.read_text().splitlines()[1:]
+
+
+@pytest.mark.usefixtures("set_default_env")
+def test_runner_downloads_sites_concurrently(civic_scraper_dir):
+    "Downloads from sites on different hosts should share one pool"
+    urls = [f"https://{host}.gov" for host in "abcd"]
+    sites = {}
+    for url in urls:
+        sites[url] = Mock(name=url)
+        sites[url].scrape.return_value = [Asset(f"{url}/agenda.pdf")]
+    # Every site's download must be in flight at once to get past this,
+    # which also means each site's metadata was written without waiting
+    barrier = threading.Barrier(len(urls), timeout=5)
+    to_patch = "civic_scraper.runner.Runner._get_site_class"
+    with (
+        patch(to_patch) as mock_method,
+        patch.object(Asset, "download", side_effect=lambda *a, **k: barrier.wait()),
+    ):
+        mock_method.return_value = lambda url, **kwargs: sites[url]
+        r = Runner(civic_scraper_dir)
+        with patch("civic_scraper.runner.logger") as logger:
+            r.scrape(
+                "2020-12-01", "2020-12-01", urls, download=True, download_workers=16
+            )
+    failures = [c for c in logger.warning.call_args_list if "Failed" in c.args[0]]
+    assert not failures
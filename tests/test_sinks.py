@@ -0,0 +1,39 @@
+import csv
+import json
+from datetime import date
+
+import pytest
+
+from civic_scraper.base.asset import Asset
+from civic_scraper.base.sinks import METADATA_FIELDS, open_sink
+
+
+def test_csv_sink_flushes_each_batch(tmpdir):
+    "Rows should be readable from disk after every write, before close"
+    with open_sink(str(tmpdir), "csv") as sink:
+        sink.write([Asset("https://a.gov/1", meeting_date=date(2020, 5, 4))])
+        with open(sink.path) as fh:
+            rows = list(csv.DictReader(fh))
+        assert [(row["url"], row["meeting_date"]) for row in rows] == [
+            ("https://a.gov/1", "2020-05-04")
+        ]
+        sink.write([Asset("https://a.gov/2")])
+    assert sink.count == 2
+    with open(sink.path) as fh:
+        assert csv.DictReader(fh).fieldnames == METADATA_FIELDS
+
+
+def test_jsonl_sink(tmpdir):
+    with open_sink(str(tmpdir), "jsonl") as sink:
+        sink.write([Asset("https://a.gov/1", asset_type="agenda")])
+    assert sink.path.endswith(".jsonl")
+    with open(sink.path) as fh:
+        (row,) = [json.loads(line) for line in fh]
+    assert list(row) == METADATA_FIELDS
+    assert row["url"] == "https://a.gov/1"
+    assert row["asset_type"] == "agenda"
+
+
+def test_unknown_format(tmpdir):
+    with pytest.raises(ValueError):
+        open_sink(str(tmpdir), "xml")